@@ -0,0 +1,59 @@
+# coding=utf-8
+import datetime
+
+import solution as f
+
+
+NUM_DATES = 40
+
+attrs = {'date_%i' % i: f.Date() for i in range(NUM_DATES)}
+attrs['when'] = f.SplittedDateTime()
+DatesForm = type('DatesForm', (f.Form,), attrs)
+
+
+def _row_data(prefix=u''):
+    data = {}
+    for i in range(NUM_DATES):
+        data[prefix + 'date_%i' % i] = u'2019-%02i-%02i' % (
+            i % 12 + 1, i % 28 + 1)
+    data[prefix + 'when'] = u'2019-06-30'
+    data[prefix + 'when_time'] = u'10:30 PM'
+    return data
+
+
+def _obj():
+    obj = {'date_%i' % i: datetime.datetime(2019, 1, i % 28 + 1)
+           for i in range(NUM_DATES)}
+    obj['when'] = datetime.datetime(2019, 6, 30, 22, 30)
+    return obj
+
+
+def bench_init_40_dates():
+    data = _row_data()
+    return lambda: DatesForm(data, tz='America/Lima')
+
+
+def bench_is_valid_40_dates():
+    data = _row_data()
+
+    def run():
+        form = DatesForm(data, tz='America/Lima')
+        assert form.is_valid()
+    return run
+
+
+def bench_render_40_dates():
+    form = DatesForm(obj=_obj(), tz='America/Lima')
+    return lambda: [field() for field in form]
+
+
+def bench_formset_is_valid_100_rows_40_dates():
+    data = {}
+    for i in range(1, 101):
+        data.update(_row_data(u'rows.%i-' % i))
+
+    def run():
+        formset = f.FormSet(DatesForm, name='rows', data=data,
+                            tz='America/Lima')
+        assert formset.is_valid()
+    return run
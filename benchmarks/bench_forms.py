@@ -0,0 +1,49 @@
+# coding=utf-8
+import solution as f
+
+
+def make_form_class(num_fields=10, num_methods=0):
+    attrs = {}
+    for i in range(num_fields):
+        attrs['field_%i' % i] = f.Text()
+    for i in range(num_methods):
+        attrs['method_%i' % i] = lambda self: None
+    return type('BenchForm', (f.Form,), attrs)
+
+
+def _init(num_methods):
+    FormClass = make_form_class(num_fields=10, num_methods=num_methods)
+    data = {'field_%i' % i: u'value' for i in range(10)}
+    return lambda: FormClass(data)
+
+
+def bench_init_10_fields_0_methods():
+    return _init(0)
+
+
+def bench_init_10_fields_100_methods():
+    return _init(100)
+
+
+def bench_init_10_fields_1000_methods():
+    return _init(1000)
+
+
+def _init_fields(num_fields):
+    FormClass = make_form_class(num_fields=num_fields)
+    data = {'field_%i' % i: u'value' for i in range(num_fields)}
+    return lambda: FormClass(data)
+
+
+def bench_init_100_fields():
+    return _init_fields(100)
+
+
+def bench_init_1000_fields():
+    return _init_fields(1000)
+
+
+def bench_as_json_100_fields():
+    FormClass = make_form_class(num_fields=100)
+    form = FormClass({'field_%i' % i: u'value' for i in range(100)})
+    return form.as_json
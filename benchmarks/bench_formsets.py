@@ -0,0 +1,83 @@
+# coding=utf-8
+import json
+
+import solution as f
+from solution.utils import json_serial
+
+
+class RowForm(f.Form):
+    name = f.Text()
+    email = f.Text(validate=[f.ValidEmail])
+    age = f.Number(type=int)
+
+
+def _formset_data(num_rows):
+    data = {}
+    for i in range(1, num_rows + 1):
+        data['rows.%i-name' % i] = u'Name %i' % i
+        data['rows.%i-email' % i] = u'user%i@example.com' % i
+        data['rows.%i-age' % i] = u'%i' % (20 + i % 50)
+    return data
+
+
+def _init(num_rows):
+    data = _formset_data(num_rows)
+    return lambda: f.FormSet(RowForm, name='rows', data=data)
+
+
+def bench_init_10_rows():
+    return _init(10)
+
+
+def bench_init_100_rows():
+    return _init(100)
+
+
+def bench_init_1000_rows():
+    return _init(1000)
+
+
+def bench_is_valid_100_rows():
+    formset = f.FormSet(RowForm, name='rows', data=_formset_data(100))
+    assert formset.is_valid()
+    return formset.is_valid
+
+
+def _json(num_rows, as_json):
+    formset = f.FormSet(RowForm, name='rows', data=_formset_data(num_rows))
+    formset.is_valid()
+    return lambda: as_json(formset)
+
+
+def bench_as_json_1000_rows():
+    return _json(1000, lambda formset: formset.as_json())
+
+
+def bench_as_json_1000_rows_from_dict():
+    return _json(1000, lambda formset: json.dumps(
+        formset.as_dict(), default=json_serial))
+
+
+def bench_dump_json_1000_rows():
+    return _json(1000, lambda formset: formset.dump_json(NullFile()))
+
+
+class NullFile(object):
+    def write(self, data):
+        pass
+
+
+class WrapForm(f.Form):
+    title = f.Text()
+    rows = f.FormSet(RowForm)
+    others = f.FormSet(RowForm)
+
+
+def bench_wrap_form_as_dict_10_rows():
+    form = WrapForm(_formset_data(10))
+    return form.as_dict
+
+
+def bench_wrap_form_template():
+    form = WrapForm(_formset_data(10))
+    return lambda: form.rows.get_template().form
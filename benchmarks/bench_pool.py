@@ -0,0 +1,40 @@
+# coding=utf-8
+"""A request loop creating a new form for each request vs. reusing them
+with `Form.acquire()` and `release()`."""
+import solution as f
+
+
+class AddressForm(f.Form):
+    street = f.Text()
+    city = f.Text(validate=[f.Required])
+
+
+class ContactForm(f.Form):
+    name = f.Text(validate=[f.Required])
+    email = f.Text(validate=[f.ValidEmail])
+    phone = f.Text()
+    notes = f.Text()
+    address = AddressForm
+    others = f.FormSet(AddressForm)
+
+
+DATA = {
+    'name': u'Juan', 'email': u'juan@example.com', 'phone': u'123',
+    'address.street': u'Av. Larco 123', 'address.city': u'Lima',
+    'others.1-city': u'Cusco', 'others.2-city': u'Arequipa',
+}
+
+
+def bench_request_new_form():
+    def request():
+        form = ContactForm(DATA)
+        form.is_valid()
+    return request
+
+
+def bench_request_pooled_form():
+    def request():
+        form = ContactForm.acquire(DATA)
+        form.is_valid()
+        form.release()
+    return request
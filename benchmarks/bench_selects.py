@@ -0,0 +1,22 @@
+# coding=utf-8
+import solution as f
+
+
+def _select(num_items):
+    items = [(i, u'Item %d' % i) for i in range(num_items)]
+    field = f.Select(items=items)
+    field.name = u'select'
+    field.load_data(u'%d' % (num_items // 2))
+    return field
+
+
+def bench_as_select_100_items():
+    return _select(100).as_select
+
+
+def bench_as_select_10000_items():
+    return _select(10000).as_select
+
+
+def bench_as_radios_2000_items():
+    return _select(2000).as_radios
@@ -0,0 +1,73 @@
+# coding=utf-8
+import datetime
+import json
+
+import solution as f
+from solution import serializers
+from solution.utils import json_serial
+
+
+NUM_ROWS = 200
+
+
+class RowForm(f.Form):
+    name = f.Text()
+    email = f.Text(validate=[f.ValidEmail])
+    kind = f.Select(items=[(u'a', u'Alpha'), (u'b', u'Beta'), (u'c', u'Ñu')])
+    start = f.Date()
+    at = f.Time()
+
+
+class AddressForm(f.Form):
+    street = f.Text()
+    city = f.Text()
+
+
+class BigForm(f.Form):
+    title = f.Text()
+    address = AddressForm
+    rows = f.FormSet(RowForm)
+    others = f.FormSet(RowForm)
+
+
+def _make_form():
+    data = {'title': u'Big', 'address.street': u'Main St.'}
+    for name in ('rows', 'others'):
+        for i in range(1, NUM_ROWS + 1):
+            prefix = '%s.%i-' % (name, i)
+            data[prefix + 'name'] = u'Name %i' % i
+            data[prefix + 'email'] = u'user%i@example.com' % i
+            data[prefix + 'kind'] = u'abc'[i % 3]
+            data[prefix + 'start'] = u'2019-06-%02i' % (i % 28 + 1)
+            data[prefix + 'at'] = u'10:%02i' % (i % 60)
+    form = BigForm(data)
+    form.is_valid()
+    # Rendered values are dates and times, not strings
+    for formset in (form.rows, form.others):
+        for row in formset:
+            row.start.obj_value = datetime.datetime(2019, 6, 30)
+            row.at.obj_value = datetime.time(10, 30)
+    return form
+
+
+def bench_as_dict_json_dumps():
+    form = _make_form()
+    return lambda: json.dumps(form.as_dict(), default=json_serial)
+
+
+def _make_bench(name, bytes):
+    def bench():
+        form = _make_form()
+        serializer = serializers.get_serializer(name)
+        return lambda: form.as_json(bytes=bytes, serializer=serializer)
+    return bench
+
+
+for _class in serializers._registry:
+    try:
+        serializers.get_serializer(_class.name)
+    except ImportError:
+        continue
+    globals()['bench_as_json_' + _class.name] = _make_bench(_class.name, False)
+    globals()['bench_as_json_bytes_' + _class.name] = _make_bench(
+        _class.name, True)
@@ -0,0 +1,34 @@
+# coding=utf-8
+from solution.fields import parsing
+
+
+NUM_VALUES = 1000000
+
+
+def _values():
+    """A million times, as sent by `type=time` inputs (`HH:MM`) and by
+    text inputs (`h:mm am`)."""
+    times = []
+    for hour in range(24):
+        for minute in range(60):
+            times.append(u'%02i:%02i' % (hour, minute))
+            times.append(u'%i:%02i %s' % (
+                hour % 12 or 12, minute, u'pm' if hour >= 12 else u'am'))
+    return [times[i % len(times)] for i in range(NUM_VALUES)]
+
+
+def _parse(parse):
+    values = _values()
+
+    def run():
+        for value in values:
+            parse(value)
+    return run
+
+
+def bench_parse_1m_times():
+    return _parse(parsing.parse_time)
+
+
+def bench_parse_1m_times_uncached():
+    return _parse(parsing._parse_time)
@@ -0,0 +1,122 @@
+# coding=utf-8
+import atexit
+import io
+import os
+import shutil
+import tempfile
+
+from werkzeug.datastructures import FileStorage
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from solution.fields.file import helpers
+from solution.fields.file.helpers import FileSystemUploader
+
+
+def _save(size):
+    base_path = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, base_path, True)
+    uploader = FileSystemUploader(base_path, allowed=True)
+    content = b'x' * size
+
+    def save():
+        filesto = FileStorage(io.BytesIO(content), filename='file.txt')
+        uploader.delete_file(uploader.save(filesto, secret=True))
+    return save
+
+
+def bench_save_1kb():
+    return _save(1024)
+
+
+def bench_save_1mb():
+    return _save(1024 * 1024)
+
+
+def bench_save_1mb_sha256():
+    base_path = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, base_path, True)
+    uploader = FileSystemUploader(base_path, allowed=True)
+    content = b'x' * 1024 * 1024
+
+    def save():
+        filesto = FileStorage(io.BytesIO(content), filename='file.txt')
+        path, _ = uploader.save(filesto, secret=True, digest='sha256')
+        uploader.delete_file(path)
+    return save
+
+
+def bench_reject_10mb_over_1mb():
+    """An upload that doesn't declare its size."""
+    base_path = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, base_path, True)
+    uploader = FileSystemUploader(
+        base_path, allowed=True, max_size=1024 * 1024)
+    content = b'x' * 10 * 1024 * 1024
+
+    def save():
+        filesto = FileStorage(io.BytesIO(content), filename='file.txt',
+                              content_length=1)
+        try:
+            uploader.save(filesto, secret=True)
+        except RequestEntityTooLarge:
+            pass
+    return save
+
+
+NUM_FILES = 10000
+
+
+def _make_dir(num_files=NUM_FILES):
+    """A directory where `image.jpg` has been uploaded `num_files` times."""
+    base_path = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, base_path, True)
+    for i in range(num_files):
+        name = 'image_%i.jpg' % i if i else 'image.jpg'
+        open(os.path.join(base_path, name), 'w').close()
+    return base_path
+
+
+def _reserve(base_path):
+    filename = helpers.reserve_unique_filename(base_path, '', 'image', '.jpg')
+    os.remove(os.path.join(base_path, filename))
+
+
+def bench_unique_filename_10k_files():
+    base_path = _make_dir()
+    return lambda: _reserve(base_path)
+
+
+def bench_unique_filename_10k_files_cold():
+    """Every time with an empty cache, eg: in a new process."""
+    base_path = _make_dir()
+
+    def reserve():
+        helpers._next_indexes.clear()
+        _reserve(base_path)
+    return reserve
+
+
+def bench_unique_filename_10k_files_probe_loop():
+    """The exists-probe loop used before, for comparison."""
+    base_path = _make_dir()
+
+    def probe():
+        i = 0
+        while True:
+            name = helpers.get_filename('image', i, '.jpg')
+            if not os.path.exists(os.path.join(base_path, name)):
+                return name
+            i += 1
+    return probe
+
+
+def bench_save_1kb_10k_files():
+    """Yet another `image.jpg` upload."""
+    base_path = _make_dir()
+    uploader = FileSystemUploader(base_path, allowed=True)
+    content = b'x' * 1024
+
+    def save():
+        filesto = FileStorage(io.BytesIO(content), filename='image.jpg')
+        uploader.delete_file(uploader.save(filesto))
+    return save
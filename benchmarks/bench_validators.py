@@ -0,0 +1,76 @@
+# coding=utf-8
+"""`Form.is_valid()` of a form with three fields using each validator."""
+import datetime
+
+import solution as f
+
+
+PAST = datetime.datetime(2000, 1, 1)
+FUTURE = datetime.datetime(2100, 1, 1)
+
+#: name: (field, valid value)
+VALIDATORS = {
+    'required': (lambda: f.Text(validate=[f.Required]), u'abc'),
+    'is_number': (lambda: f.Number(validate=[f.IsNumber]), u'42'),
+    'is_date': (lambda: f.Date(validate=[f.IsDate]), u'2015-05-10'),
+    'is_time': (lambda: f.Time(validate=[f.IsTime]), u'10:30 AM'),
+    'before': (lambda: f.Date(validate=[f.Before(FUTURE)]), u'2015-05-10'),
+    'after': (lambda: f.Date(validate=[f.After(PAST)]), u'2015-05-10'),
+    'before_now': (lambda: f.Date(validate=[f.BeforeNow]), u'2015-05-10'),
+    'after_now': (lambda: f.Date(validate=[f.AfterNow]), u'2095-05-10'),
+    'longer_than': (lambda: f.Text(validate=[f.LongerThan(2)]), u'abc'),
+    'shorter_than': (lambda: f.Text(validate=[f.ShorterThan(5)]), u'abc'),
+    'less_than': (lambda: f.Number(validate=[f.LessThan(100)]), u'42'),
+    'more_than': (lambda: f.Number(validate=[f.MoreThan(10)]), u'42'),
+    'in_range': (lambda: f.Number(validate=[f.InRange(10, 100)]), u'42'),
+    'match': (lambda: f.Text(validate=[f.Match(r'[a-z]+$')]), u'abc'),
+    'valid_email': (lambda: f.Text(validate=[f.ValidEmail]), u'a@example.com'),
+    'valid_url': (
+        lambda: f.Text(validate=[f.ValidURL]), u'http://example.com'),
+    'valid_color': (lambda: f.Text(validate=[f.ValidColor]), u'#ff00ff'),
+}
+
+#: name: (validator, {field: valid value})
+FORM_VALIDATORS = {
+    'are_equal': (
+        lambda: f.AreEqual('field_0', 'field_1'),
+        {'field_0': u'abc', 'field_1': u'abc', 'field_2': u'xyz'}),
+    'at_least_one': (
+        lambda: f.AtLeastOne(['field_0', 'field_1']),
+        {'field_0': u'abc', 'field_1': u'', 'field_2': u'xyz'}),
+    'valid_split_date': (
+        lambda: f.ValidSplitDate('field_0', 'field_1', 'field_2'),
+        {'field_0': u'10', 'field_1': u'5', 'field_2': u'2015'}),
+}
+
+
+def _is_valid(attrs, data):
+    FormClass = type('BenchForm', (f.Form,), attrs)
+    form = FormClass(data)
+    assert form.is_valid(), form._errors
+    return form.is_valid
+
+
+def _make_bench(name):
+    field, value = VALIDATORS[name]
+
+    def bench():
+        attrs = {'field_%i' % i: field() for i in range(3)}
+        return _is_valid(attrs, {'field_%i' % i: value for i in range(3)})
+    return bench
+
+
+def _make_form_bench(name):
+    validator, data = FORM_VALIDATORS[name]
+
+    def bench():
+        attrs = {'field_%i' % i: f.Text() for i in range(3)}
+        attrs['field_0'] = f.Text(validate=[validator()])
+        return _is_valid(attrs, data)
+    return bench
+
+
+for _name in VALIDATORS:
+    globals()['bench_is_valid_' + _name] = _make_bench(_name)
+for _name in FORM_VALIDATORS:
+    globals()['bench_is_valid_' + _name] = _make_form_bench(_name)
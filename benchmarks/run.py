@@ -0,0 +1,197 @@
+# coding=utf-8
+"""
+Runs the benchmarks of this directory.
+
+Every ``bench_*.py`` module can define any number of ``bench_*`` functions.
+Each one does its setup and returns a callable without arguments: the code
+to be timed.
+
+    python benchmarks/run.py [name_filter] [--save NAME] [--compare NAME]
+                             [--gc] [--memory]
+
+The results can be saved as a named baseline (in ``benchmarks/.results/``)
+and later compared against it. When comparing, any benchmark slower than
+the baseline by more than the threshold (10% by default) is flagged as a
+regression and the exit status is 1.
+
+    python benchmarks/run.py --save before
+    # ... change things ...
+    python benchmarks/run.py --compare before
+
+With ``--gc``, the number of garbage collections triggered by every 1000
+calls is also shown (`timeit` disables the collector while timing).
+With ``--memory``, the memory still allocated by what every call returns
+(eg: the size of a form instance) and the peak of memory used by a call
+are also shown.
+
+"""
+from __future__ import print_function
+import argparse
+import gc
+import glob
+import json
+import os
+import sys
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:  # Python < 3.4
+    tracemalloc = None
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(HERE, '.results')
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, HERE)
+
+
+def load_benchmarks(name_filter=None):
+    paths = sorted(glob.glob(os.path.join(HERE, 'bench_*.py')))
+    for path in paths:
+        modname = os.path.splitext(os.path.basename(path))[0]
+        module = __import__(modname)
+        for name in sorted(dir(module)):
+            if not name.startswith('bench_'):
+                continue
+            fullname = '{0}.{1}'.format(
+                modname[len('bench_'):], name[len('bench_'):])
+            if name_filter and name_filter not in fullname:
+                continue
+            yield fullname, getattr(module, name)
+
+
+def measure(func, min_time=0.2, repeat=3):
+    """Return the best time per call, in seconds."""
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10
+    best = min([elapsed] + timer.repeat(repeat - 1, number))
+    return best / number
+
+
+def count_collections(func, per_call):
+    """Return the number of garbage collections, of any generation,
+    triggered by 1000 calls to `func` (estimated by doing less calls if
+    it's slow)."""
+    number = min(1000, max(10, int(0.2 / per_call)))
+    gc.collect()
+    before = sum(gen['collections'] for gen in gc.get_stats())
+    for _ in range(number):
+        func()
+    after = sum(gen['collections'] for gen in gc.get_stats())
+    return (after - before) * 1000.0 / number
+
+
+def measure_memory(func, number=100):
+    """Return the bytes allocated by a call to `func` that are still in
+    use while its result is alive, and the peak of memory used during
+    a call."""
+    func()  # Warm up the caches
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1] - before
+        results = [result] + [func() for _ in range(number - 1)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result, results
+    return (after - before) / float(number), peak
+
+
+def get_baseline_path(name):
+    return os.path.join(RESULTS_DIR, '{0}.json'.format(name))
+
+
+def load_baseline(name):
+    with open(get_baseline_path(name)) as f:
+        return json.load(f)
+
+
+def save_baseline(name, results):
+    """Save the results, updating those of a previous run with the same
+    name (so it can be built by running the benchmarks by parts)."""
+    if not os.path.isdir(RESULTS_DIR):
+        os.makedirs(RESULTS_DIR)
+    path = get_baseline_path(name)
+    if os.path.exists(path):
+        results = dict(load_baseline(name), **results)
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print('Saved to {0}'.format(path))
+
+
+def compare(per_call, before, threshold):
+    """Return the text to show after a result and whether it's a regression.
+    """
+    if not before:
+        return '', False
+    change = (per_call - before) / before
+    text = '{0:>+8.1%}'.format(change)
+    if change > threshold:
+        return text + '  REGRESSION', True
+    return text, False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the benchmarks.')
+    parser.add_argument('name_filter', nargs='?', default=None,
+                        help='only run the benchmarks with this in their name')
+    parser.add_argument('--save', metavar='NAME',
+                        help='save the results as the baseline NAME')
+    parser.add_argument('--compare', metavar='NAME',
+                        help='compare the results with the baseline NAME')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='slowdown flagged as a regression (default 0.1)')
+    parser.add_argument('--gc', action='store_true',
+                        help='show the garbage collections per 1000 calls')
+    parser.add_argument('--memory', action='store_true',
+                        help='show the memory kept by the result of a call '
+                             'and its peak')
+    args = parser.parse_args(argv)
+    if args.gc and not hasattr(gc, 'get_stats'):
+        parser.error('--gc needs Python 3.4 or later')
+    if args.memory and tracemalloc is None:
+        parser.error('--memory needs Python 3.4 or later')
+
+    baseline = load_baseline(args.compare) if args.compare else {}
+    results = {}
+    regressions = []
+
+    for fullname, bench in load_benchmarks(args.name_filter):
+        func = bench()
+        per_call = measure(func)
+        results[fullname] = per_call
+        text, regressed = compare(
+            per_call, baseline.get(fullname), args.threshold)
+        if regressed:
+            regressions.append(fullname)
+        if args.gc:
+            text = '{0:>8.1f} gc/1k {1}'.format(
+                count_collections(func, per_call), text)
+        if args.memory:
+            text = '{0:>10.0f} B {1:>10} B peak {2}'.format(
+                *(measure_memory(func) + (text, )))
+        print('{0:<50} {1:>12.2f} us {2}'.format(
+            fullname, per_call * 1e6, text).rstrip())
+
+    if args.save:
+        save_baseline(args.save, results)
+    if regressions:
+        print('\n{0} regression(s) against "{1}":'.format(
+            len(regressions), args.compare))
+        for fullname in regressions:
+            print('  ' + fullname)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,6 +12,7 @@
 """
 from .form import Form  # noqa
 from .formset import FormSet  # noqa
+from .instrumentation import Observer, Stats, observe, unobserved  # noqa
 from .fields import *  # noqa
 from .validators import *  # noqa
 from .utils import Markup, get_html_attrs, to_unicode  # noqa
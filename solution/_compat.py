@@ -49,3 +49,12 @@ def itervalues(d, **kw):
     if not PY2:
         return iter(d.values(**kw))
     return d.itervalues(**kw)
+
+
+def with_metaclass(meta, *bases):
+    """Create a base class with a metaclass, in a way that works on both
+    Python 2 and 3."""
+    class metaclass(meta):
+        def __new__(cls, name, this_bases, d):
+            return meta(name, bases, d)
+    return type.__new__(metaclass, 'temporary_class', (), {})
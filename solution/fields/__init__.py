@@ -6,7 +6,7 @@ from .date import Date
 from .simple_date import SimpleDate
 from .file import File, Image, IMAGES, DOCUMENTS, DATA, ARCHIVES
 from .number import Number
-from .select import Select, MultiSelect
+from .select import Select, MultiSelect, ItemsCache
 from .splitted_datetime import SplittedDateTime
 from .text import Text
 from .time import Time
@@ -36,6 +36,8 @@ class Boolean(Field):
 
     """
 
+    __slots__ = ('falsy', )
+
     def __init__(self, falsy=FALSY_VALUES, **kwargs):
         kwargs.setdefault('default', None)
         self.falsy = falsy
@@ -49,6 +49,7 @@ class Collection(Text):
         Default timezone for this field. Overwrite the form timezone.
 
     """
+    __slots__ = ('sep', 'rxsep', 'filters')
     _type = 'text'
 
     def __init__(self, sep=', ', filters=None, **kwargs):
@@ -31,6 +31,7 @@ class Color(Text):
         fields.
 
     """
+    __slots__ = ()
     _type = 'color'
     default_validator = v.IsColor
 
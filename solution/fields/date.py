@@ -5,10 +5,10 @@ import datetime
 import pytz
 
 from .. import validators as v
-from .._compat import string_types
-from ..utils import Markup, get_html_attrs
+from ..utils import Markup, get_html_attrs, get_timezone
 
 from .field import ValidationError
+from .parsing import parse_date, to_utc
 from .text import Text
 
 
@@ -43,6 +43,7 @@ class Date(Text):
         Default timezone for this field.
 
     """
+    __slots__ = ()
     _type = 'date'
     default_validator = v.IsDate
 
@@ -51,9 +52,7 @@ class Date(Text):
         return super(Date, self).__init__(**kwargs)
 
     def _get_tz(self):
-        tz = self.tz or pytz.utc
-        if tz and isinstance(tz, string_types):
-            tz = pytz.timezone(tz)
+        tz = get_timezone(self.tz) or pytz.utc
         self.tz = tz
         return tz
 
@@ -67,9 +66,7 @@ class Date(Text):
     def _to_utc(self, dt):
         """Takes a naive timezone with an localized value and return it formatted
         as utc."""
-        tz = self._get_tz()
-        loc_dt = tz.localize(dt)
-        return loc_dt.astimezone(pytz.utc)
+        return to_utc(dt, self._get_tz())
 
     def py_to_str(self, **kwargs):
         dt = self.obj_value or self.default
@@ -106,8 +103,7 @@ class Date(Text):
         if not self.str_value:
             return None
         try:
-            ldt = [int(f) for f in self.str_value.split('-')]
-            dt = datetime.datetime(*ldt)
+            dt = parse_date(self.str_value)
         except (ValueError, TypeError):
             raise ValidationError
         dt = self._to_utc(dt)
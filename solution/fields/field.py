@@ -6,7 +6,63 @@ import pytz
 
 from .. import validators as v
 from .._compat import string_types, to_unicode, implements_to_string
-from ..utils import Markup, get_html_attrs
+from ..utils import Markup, get_html_attrs, get_timezone
+
+
+#: Attributes of a field that change from one form instance to another.
+#: Everything else is part of the field definition and is shared.
+BOUND_STATE = (
+    'name', 'form', 'prepare', 'clean', 'locale', 'tz',
+    'str_value', 'obj_value', 'file_data', 'error', 'has_changed', 'empty',
+    'dirty', '_id', '_deleted',
+)
+
+
+class DefinitionAttr(object):
+
+    """An attribute of a field definition, stored in its `_attrs` dict
+    instead of in a slot. The bound fields of a definition share that dict
+    (see `Field.bind`) until one of them, or the definition, changes any of
+    these attributes: then it gets its own copy first."""
+
+    __slots__ = ('name', )
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, field, cls=None):
+        if field is None:
+            return self
+        try:
+            return field._attrs[self.name]
+        except (AttributeError, KeyError):
+            raise AttributeError(self.name)
+
+    def __set__(self, field, value):
+        get_own_attrs(field)[self.name] = value
+
+    def __delete__(self, field):
+        try:
+            del get_own_attrs(field)[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+
+
+#: Key of the `_attrs` of a definition once they are shared by bound fields
+SHARED = '_shared'
+
+
+def get_own_attrs(field):
+    """Return the `_attrs` dict of `field`, copying it first if it's shared
+    with other fields."""
+    attrs = getattr(field, '_attrs', None)
+    if attrs is None:
+        attrs = field._attrs = {}
+    elif SHARED in attrs:
+        attrs = dict(attrs)
+        del attrs[SHARED]
+        field._attrs = attrs
+    return attrs
 
 
 class ValidationError(Exception):
@@ -46,18 +102,34 @@ class Field(object):
         validator is present
 
     """
-    name = 'field'
-    form = None
+    # Fields have no `__dict__` (unless a subclass doesn't declare its own
+    # `__slots__`) to keep the forms small.
+    __slots__ = BOUND_STATE + ('_attrs', )
+
     default_validator = None
+    bound_state = BOUND_STATE
 
-    str_value = None
-    obj_value = None
-    error = None
-    has_changed = False
-    empty = True
+    validators = DefinitionAttr('validators')
+    field_validators = DefinitionAttr('field_validators')
+    form_validators = DefinitionAttr('form_validators')
+    _default = DefinitionAttr('_default')
+    hide_value = DefinitionAttr('hide_value')
+    optional = DefinitionAttr('optional')
+    extra = DefinitionAttr('extra')
 
     def __init__(self, validate=None, default=None, prepare=None, clean=None,
                  hide_value=False, optional=None, locale=None, tz=None, **kwargs):
+        self.name = 'field'
+        self.form = None
+        self.str_value = None
+        self.obj_value = None
+        self.file_data = None
+        self.error = None
+        self.has_changed = False
+        self.empty = True
+        #: If the data has changed since the field was last validated by
+        #: its form
+        self.dirty = True
         self._set_validators(validate)
         self._default = default
         self.prepare = prepare
@@ -67,9 +139,64 @@ class Field(object):
             optional = not validator_in(v.Required, self.validators)
         self.optional = optional
         self.locale = locale
-        self.tz = tz
+        self.tz = get_timezone(tz)
         self.extra = kwargs
 
+    def bind(self, form, name, prepare=None, clean=None):
+        """Return a new field, bound to `form`, for this definition.
+
+        The bound field shares the `_attrs` of the definition, copies the
+        rest of its attributes and starts with a new per-instance state
+        (see `BOUND_STATE`), so binding is cheaper than copying the field.
+        `prepare` and `clean` are used if the field doesn't already have
+        its own.
+        """
+        cls = self.__class__
+        bound = cls.__new__(cls)
+        for key, descr in get_definition_slots(cls):
+            try:
+                descr.__set__(bound, descr.__get__(self, cls))
+            except AttributeError:  # not set
+                pass
+        attrs = getattr(self, '_attrs', None)
+        if attrs is not None:
+            attrs[SHARED] = True
+            bound._attrs = attrs
+        if hasattr(self, '__dict__'):
+            bound.__dict__.update(self.__dict__)
+        bound.name = name
+        bound.form = form
+        bound.prepare = self.prepare or prepare
+        bound.clean = self.clean or clean
+        bound.locale = self.locale
+        bound.tz = self.tz
+        bound.str_value = None
+        bound.obj_value = None
+        bound.file_data = None
+        bound.error = None
+        bound.has_changed = False
+        bound.empty = True
+        bound.dirty = True
+        return bound
+
+    def __copy__(self):
+        """Copy the `_attrs` of the definition too, so changing them in the
+        copy doesn't change the original."""
+        cls = self.__class__
+        new = cls.__new__(cls)
+        for key, descr in get_slots(cls).items():
+            try:
+                value = descr.__get__(self, cls)
+            except AttributeError:
+                continue
+            if key == '_attrs':
+                value = dict(value)
+                value.pop(SHARED, None)
+            descr.__set__(new, value)
+        if hasattr(self, '__dict__'):
+            new.__dict__.update(self.__dict__)
+        return new
+
     def _set_validators(self, validators):
         validators = validators or []
         if not isinstance(validators, list):
@@ -79,6 +206,13 @@ class Field(object):
             validators.append(defval)
         self.validators = [
             val() if inspect.isclass(val) else val for val in validators]
+        # Partitioned once here instead of on every validation
+        self.field_validators = [
+            val for val in self.validators
+            if not isinstance(val, v.FormValidator)]
+        self.form_validators = [
+            val for val in self.validators
+            if isinstance(val, v.FormValidator)]
 
     @property
     def required(self):
@@ -106,7 +240,15 @@ class Field(object):
         self.str_value = None
         self.obj_value = None
         self.file_data = None
+        self.error = None
+        self.has_changed = False
         self.empty = True
+        self.dirty = True
+        for name in ('_id', '_deleted'):
+            try:
+                delattr(self, name)
+            except AttributeError:
+                pass
 
     def load_data(self, str_value=None, obj_value=None,
                   file_data=None, locale=None, tz=None, **kwargs):
@@ -114,6 +256,9 @@ class Field(object):
             str_value, file_data, obj_value)
         if self.prepare:
             obj_value = self.prepare(obj_value, **kwargs)
+        if (str_value != self.str_value or file_data is not self.file_data or
+                obj_value is not self.obj_value):
+            self.dirty = True
         self.str_value = str_value
         self.file_data = file_data
         self.obj_value = obj_value
@@ -121,10 +266,7 @@ class Field(object):
 
         self.locale = self.locale or locale
 
-        tz = self.tz or tz or pytz.utc
-        if tz and isinstance(tz, string_types):
-            tz = pytz.timezone(tz)
-        self.tz = tz
+        self.tz = get_timezone(self.tz or tz) or pytz.utc
 
     def _clean_data(self, str_value, file_data, obj_value):
         if isinstance(str_value, (list, tuple)):
@@ -199,19 +341,27 @@ class Field(object):
         return py_value is None
 
     def validate_value(self, form, py_value):
-        for validator in self.validators:
-            if isinstance(validator, v.FormValidator):
-                continue
-            if not validator(py_value, form):
+        observer = getattr(form, '_observer', None)
+        for validator in self.field_validators:
+            valid = validator(py_value, form)
+            if observer is not None:
+                observer.on_validator(self, validator, bool(valid))
+            if not valid:
                 self.error = ValidationError(validator.message)
                 return None
         return py_value
 
-    def validate_form(self, form, cleaned_data):
-        for validator in self.validators:
-            if not isinstance(validator, v.FormValidator):
-                continue
-            if not validator(cleaned_data, form):
+    def validate_form(self, form, cleaned_data, validators=None):
+        """Run the form validators of this field, or just `validators` if
+        given, until one of them fails."""
+        if validators is None:
+            validators = self.form_validators
+        observer = getattr(form, '_observer', None)
+        for validator in validators:
+            valid = validator(cleaned_data, form)
+            if observer is not None:
+                observer.on_validator(self, validator, bool(valid))
+            if not valid:
                 self.error = ValidationError(validator.message)
                 break
 
@@ -259,6 +409,37 @@ class Field(object):
         }
 
 
+def get_slots(cls):
+    """Return `{name: slot descriptor}` for all the `__slots__` of `cls`
+    and its bases."""
+    slots = cls.__dict__.get('_all_slots')
+    if slots is not None:
+        return slots
+    slots = {}
+    for klass in reversed(cls.__mro__):
+        names = klass.__dict__.get('__slots__', ())
+        if isinstance(names, string_types):
+            names = (names, )
+        for name in names:
+            if not name.startswith('__'):
+                slots[name] = klass.__dict__[name]
+    cls._all_slots = slots
+    return slots
+
+
+def get_definition_slots(cls):
+    """Return the `(name, slot descriptor)` of the slots of `cls` that are
+    part of the field definition, copied to the bound fields."""
+    slots = cls.__dict__.get('_definition_slots')
+    if slots is None:
+        slots = [
+            (key, descr) for key, descr in get_slots(cls).items()
+            if key not in cls.bound_state and key != '_attrs'
+        ]
+        cls._definition_slots = slots
+    return slots
+
+
 def validator_in(validator, validators_list):
     for val in validators_list:
         if (val == validator) or isinstance(val, validator):
@@ -2,11 +2,14 @@
 from __future__ import print_function
 
 import errno
+import hashlib
 from math import ceil
 import os
 import shutil
 import uuid
 
+from ...utils import LRUCache
+
 try:
     from werkzeug.exceptions import RequestEntityTooLarge, UnsupportedMediaType
     from werkzeug.utils import secure_filename
@@ -27,31 +30,205 @@ DATA = ('.csv', '.json', '.xml', '.ini', '.plist', '.yaml', '.yml',)
 
 ARCHIVES = ('.zip', '.gz', '.bz2', '.tar', '.7z',)
 
+#: Size of the blocks in which the uploads are copied to disk
+CHUNK_SIZE = 64 * 1024
+
+# Atomic, even if the destination exists, also on Windows (Python 3.3+)
+replace_file = getattr(os, 'replace', os.rename)
+
 
 def get_random_filename():
     return str(uuid.uuid4())
 
 
+def get_filename(name, i=0, ext=''):
+    """Return the secure version of `name` (plus `_i` if `i` isn't 0) with
+    the extension `ext`."""
+    if i:
+        filename = secure_filename(u'{0}_{1}'.format(name, i))
+    else:
+        filename = secure_filename(name)
+    if ext:
+        filename = u'{0}.{1}'.format(filename, ext.strip('.'))
+    return filename
+
+
+def find_free_index(abspath, name, ext='', start=0):
+    """Return an `i` >= `start` for which `get_filename(name, i, ext)`
+    doesn't exist in `abspath`.
+
+    The names are usually taken in order, so instead of checking them one
+    by one, this does an exponential search for a free one and then a
+    binary search for the first free one after the taken ones: O(log n)
+    checks for n existing files.
+    """
+    def exists(i):
+        return os.path.exists(
+            os.path.join(abspath, get_filename(name, i, ext)))
+
+    if not exists(start):
+        return start
+    taken, step = start, 1
+    free = start + step
+    while exists(free):
+        taken = free
+        step *= 2
+        free = start + step
+    while free - taken > 1:
+        middle = (taken + free) // 2
+        if exists(middle):
+            taken = middle
+        else:
+            free = middle
+    return free
+
+
 def get_unique_filename(root_path, path, name, ext=''):
-    """ """
-    path = os.path.join(root_path, path)
-    abspath = os.path.abspath(path)
-    i = 0
+    """Return a filename, based on `name`, that doesn't exist yet in the
+    `path` directory. Another process could take it before it's used, so
+    prefer `reserve_unique_filename`."""
+    abspath = os.path.abspath(os.path.join(root_path, path))
+    return get_filename(name, find_free_index(abspath, name, ext), ext)
+
+
+#: Next index to try by `(directory, name, ext)`, for the names that
+#: have been taken more than once
+_next_indexes = LRUCache(maxsize=1024)
+
+#: After these many names already taken in a row, search for a free one
+#: instead of trying the next.
+MAX_COLLISIONS = 3
+
+
+def claim_unique_filename(root_path, path, name, ext='', claim=None):
+    """Return a filename, based on `name`, in the `path` directory that
+    has been atomically taken with `claim(fullpath)`.
+
+    `claim` must fail with `OSError` (`EEXIST`) if the path exists; by
+    default it creates an empty file with `O_CREAT | O_EXCL`. Because of
+    that, two threads or processes can never get the same name.
+
+    The next index to try for the names that have been taken before is
+    cached, so usually this costs a single `claim`; otherwise the free
+    index is searched with `find_free_index`. Unlike
+    `get_unique_filename`, the names of deleted files aren't reused.
+    """
+    claim = claim or _create_empty_file
+    abspath = os.path.abspath(os.path.join(root_path, path))
+    key = (abspath, name, ext)
+    i = _next_indexes.get(key)
+    if i is None:
+        # Most names are new, so try without the suffix before searching
+        i = 0
+        collisions = MAX_COLLISIONS - 1
+    else:
+        collisions = 0
     while True:
+        filename = get_filename(name, i, ext)
+        try:
+            claim(os.path.join(abspath, filename))
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+            # Taken by another process or thread since
+            collisions += 1
+            if collisions >= MAX_COLLISIONS:
+                i = find_free_index(abspath, name, ext, i + 1)
+                collisions = 0
+            else:
+                i += 1
+            continue
         if i:
-            filename = u'{0}_{1}'.format(name, i)
-            filename = secure_filename(filename)
+            _next_indexes.set(key, i + 1)
+        return filename
+
+
+def _create_empty_file(fullpath):
+    _, fd = create_file(*os.path.split(fullpath))
+    os.close(fd)
+
+
+def reserve_unique_filename(root_path, path, name, ext=''):
+    """Create an empty file with a unique name based on `name` in the
+    `path` directory and return its name. See `claim_unique_filename`."""
+    return claim_unique_filename(root_path, path, name, ext)
+
+
+def move_to_unique_filename(filepath, root_path, path, name, ext=''):
+    """Move the file at `filepath` to a unique name, based on `name`, in
+    the `path` directory and return that name. It's atomic and never
+    replaces another file.
+
+    Where hard links are supported, the name is claimed by linking the
+    file to it, which is cheaper than reserving it with an empty file
+    and then replacing that.
+    """
+    link = getattr(os, 'link', None)
+    if link is not None:
+        try:
+            filename = claim_unique_filename(
+                root_path, path, name, ext,
+                claim=lambda fullpath: link(filepath, fullpath))
+        except OSError:
+            pass  # Eg: a filesystem without hard links
         else:
-            filename = secure_filename(name)
-        if ext:
-            filename = u'{0}.{1}'.format(filename, ext.strip('.'))
-        filepath = os.path.join(abspath, filename)
-        if not os.path.exists(filepath):
-            break
-        i += 1
+            os.remove(filepath)
+            return filename
+
+    filename = reserve_unique_filename(root_path, path, name, ext)
+    fullpath = os.path.join(
+        os.path.abspath(os.path.join(root_path, path)), filename)
+    try:
+        replace_file(filepath, fullpath)
+    except BaseException:
+        os.remove(fullpath)
+        raise
     return filename
 
 
+def create_file(dirpath, filename):
+    """Create a new empty file, failing with `OSError` (`EEXIST`) if it
+    already exists, and return its path and an open file descriptor.
+    Unlike `tempfile.mkstemp`, the permissions depend on the umask, as
+    for any other file."""
+    path = os.path.join(dirpath, filename)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    return path, os.open(path, flags, 0o666)
+
+
+def write_file(stream, dirpath, max_size=None, digest=None,
+               chunk_size=CHUNK_SIZE):
+    """Copy the file-like `stream` in chunks to a new temporary file in
+    `dirpath` and return its path, size and, if `digest` (the name of a
+    `hashlib` algorithm) is set, the hex digest of its content.
+
+    Raises `RequestEntityTooLarge`, and deletes the temporary file, as soon
+    as more than `max_size` bytes have been read.
+    """
+    hasher = hashlib.new(digest) if digest else None
+    temppath, fd = create_file(dirpath, '.{0}.part'.format(uuid.uuid4().hex))
+    size = 0
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            while True:
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if max_size and size > max_size:
+                    raise RequestEntityTooLarge
+                if hasher is not None:
+                    hasher.update(chunk)
+                f.write(chunk)
+    except BaseException:
+        try:
+            os.remove(temppath)
+        except OSError:
+            pass
+        raise
+    return temppath, size, hasher.hexdigest() if hasher else None
+
+
 def make_dirs(root_path, filepath):
     fullpath = os.path.join(root_path, filepath)
     fullpath = os.path.abspath(fullpath)
@@ -245,7 +422,7 @@ class FileSystemUploader(Uploader):
         self.max_size = max_size
 
     def save(self, filesto, upload_to=None, name=None, secret=None, prefix=None,
-             allowed=None, denied=None, max_size=None, **kwargs):
+             allowed=None, denied=None, max_size=None, digest=None, **kwargs):
         """
         Except for `filesto`, all of these parameters are optional, so only
         bother setting the ones relevant to *this upload*.
@@ -285,6 +462,11 @@ class FileSystemUploader(Uploader):
             Note: The attribute `max_content_length` defined in the
             `request` object has higher priority.
 
+        digest
+        :   Name of a `hashlib` algorithm, like `'sha256'`. If set, the
+            hex digest of the content is computed while saving it and
+            `(path, digest)` is returned instead of just the path.
+
         """
         if not filesto:
             return None
@@ -308,20 +490,24 @@ class FileSystemUploader(Uploader):
         else:
             new_name = get_random_filename() if secret else prefix + oname
 
-        filename = get_unique_filename(self.base_path, filepath, new_name, ext=ext)
-        fullpath = os.path.join(
-            make_dirs(self.base_path, filepath),
-            filename
-        )
-        filesto.save(fullpath)
-        filesize = os.path.getsize(fullpath)
-
-        # Post validation
-        if max_size and filesize > max_size:
-            self.delete_file(fullpath)
-            raise RequestEntityTooLarge
+        # Written to a temporary file first, so an oversized upload is
+        # rejected as soon as it's detected and a half-written file is
+        # never visible under the final name.
+        dirpath = make_dirs(self.base_path, filepath)
+        temppath, _, hexdigest = write_file(
+            getattr(filesto, 'stream', filesto), dirpath,
+            max_size=max_size or self.max_size, digest=digest)
+        try:
+            filename = move_to_unique_filename(
+                temppath, self.base_path, filepath, new_name, ext=ext)
+        except BaseException:
+            self.delete_file(temppath)
+            raise
 
-        return os.path.join(filepath, filename)
+        path = os.path.join(filepath, filename)
+        if digest:
+            return path, hexdigest
+        return path
 
     __call__ = save
 
@@ -28,6 +28,7 @@ class Number(Text):
         fields.
 
     """
+    __slots__ = ('type', )
     _type = 'number'
     default_validator = v.IsNumber
 
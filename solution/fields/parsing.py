@@ -0,0 +1,96 @@
+# coding=utf-8
+"""
+Parsing of the date and time strings sent by the browsers and conversion
+of local datetimes to UTC, shared by the date and time fields.
+"""
+from __future__ import absolute_import
+import datetime
+import re
+
+import pytz
+
+from ..utils import LRUCache
+
+
+rx_time = re.compile(
+    r'(?P<hour>[0-9]{1,2}):(?P<minute>[0-9]{1,2})'
+    r'(:(?P<second>[0-9]{1,2}))?\s?(?P<tt>am|pm)?',
+    re.IGNORECASE
+)
+
+DIGITS = frozenset(u'0123456789')
+
+#: Parsed times by string. There are only so many different times, so
+#: instead of tracking their use the cache is emptied when it gets full.
+TIMES_CACHE_SIZE = 4096
+_times = {}
+_missing = object()
+
+#: UTC datetimes of recently converted `(local datetime, tz)` pairs.
+#: Bulk imports repeat the same few dates thousands of times and
+#: localizing with pytz is far slower than parsing.
+_utc_datetimes = LRUCache(maxsize=1024)
+
+
+def parse_date(value, cls=datetime.datetime):
+    """Parse a `YYYY-MM-DD` string into an instance of `cls`.
+
+    Strict ISO dates take a fast path where `cls.fromisoformat()` exists
+    (Python 3.7+). Anything else is split by `-`, so `2019-1-5` is also
+    accepted. Raises `ValueError` or `TypeError` if `value` isn't a date.
+    """
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        fromisoformat = getattr(cls, 'fromisoformat', None)
+        if fromisoformat is not None:
+            try:
+                return fromisoformat(value)
+            except ValueError:
+                pass
+    return cls(*[int(part) for part in value.split('-')])
+
+
+def to_utc(dt, tz):
+    """Takes a naive datetime with a local value in the `tz` timezone and
+    return it as an aware UTC datetime."""
+    key = (dt, tz)
+    utc_dt = _utc_datetimes.get(key)
+    if utc_dt is None:
+        utc_dt = tz.localize(dt).astimezone(pytz.utc)
+        _utc_datetimes.set(key, utc_dt)
+    return utc_dt
+
+
+def parse_time(value):
+    """Parse a `hh:mm`, `hh:mm:ss` or `hh:mm pm` string into a time object.
+    Returns `None` if `value` isn't a valid time."""
+    tt = _times.get(value, _missing)
+    if tt is _missing:
+        tt = _parse_time(value)
+        if len(_times) >= TIMES_CACHE_SIZE:
+            _times.clear()
+        _times[value] = tt
+    return tt
+
+
+def _parse_time(value):
+    # Fast path for the `HH:MM` sent by the `type=time` inputs
+    if len(value) == 5 and value[2] == ':' and DIGITS.issuperset(
+            value[:2] + value[3:]):
+        try:
+            return datetime.time(int(value[:2]), int(value[3:]))
+        except ValueError:
+            return None
+
+    match = rx_time.match(value.upper())
+    if not match:
+        return None
+    try:
+        gd = match.groupdict()
+        hour = int(gd['hour'])
+        minute = int(gd['minute'])
+        second = int(gd['second'] or 0)
+        if gd['tt'] == 'PM':
+            hour += 12
+        return datetime.time(hour, minute, second)
+    except (ValueError, TypeError):
+        return None
@@ -3,11 +3,13 @@ from __future__ import absolute_import
 import os
 
 from .._compat import to_unicode, string_types
-from ..utils import Markup, get_html_attrs, escape
-from .field import Field
+from ..utils import (
+    HtmlAttrsTemplate, LRUCache, Markup, get_html_attrs, escape, iter_joined)
+from .field import BOUND_STATE, Field
 
 
 TMPL = u'<label><input {attrs}> {label}</label>'
+SELECTED = u' selected'
 
 
 def iter_flatten(iterable):
@@ -22,8 +24,198 @@ def iter_flatten(iterable):
             yield str(i[0])
 
 
+class SelectedValues(object):
+
+    """The current values of a field, to test if an item is selected:
+    `val in selected` is true if `val` or `str(val)` is one of them.
+    """
+
+    def __init__(self, values):
+        self.values = values
+        self._set = None
+        if isinstance(values, (list, tuple)):
+            try:
+                self._set = frozenset(values)
+            except TypeError:  # unhashable values
+                pass
+
+    def __contains__(self, val):
+        if self._set is not None:
+            try:
+                return val in self._set or str(val) in self._set
+            except TypeError:
+                pass
+        return val in self.values or str(val) in self.values
+
+
+class ItemsIndex(object):
+
+    """Data derived from a list of items, like the set of accepted values,
+    rebuilt only when the list is replaced by another one.
+    It's shared by all the bound copies of a field.
+    """
+
+    def __init__(self):
+        self._accepted = (None, None)
+        self._options = (None, None)
+        self._keyed_accepted = LRUCache(maxsize=32)
+        self._keyed_options = LRUCache(maxsize=32)
+
+    def __reduce__(self):
+        # Copies and pickles start with an empty index, instead of trying
+        # to copy the cached data (and the lock of its cache)
+        return (self.__class__, ())
+
+    def get_accepted(self, items, key=None):
+        """Return a frozenset of the values in `items` (as strings),
+        including those inside groups. If a `key` is given, the set is
+        cached by it instead of by the identity of `items`."""
+        if key is not None:
+            accepted = self._keyed_accepted.get(key)
+            if accepted is None:
+                accepted = frozenset(iter_flatten(items))
+                self._keyed_accepted.set(key, accepted)
+            return accepted
+
+        cached_items, accepted = self._accepted
+        if accepted is None or cached_items is not items:
+            accepted = frozenset(iter_flatten(items))
+            self._accepted = (items, accepted)
+        return accepted
+
+    def get_options(self, items, compile, key=None):
+        """Return the pre-rendered options of `items`, made by
+        `compile(items)`. If a `key` is given, the options are cached by it
+        instead of by the identity of `items`."""
+        if key is not None:
+            options = self._keyed_options.get(key)
+            if options is None:
+                options = compile(items)
+                self._keyed_options.set(key, options)
+            return options
+
+        cached_items, options = self._options
+        if options is None or cached_items is not items:
+            options = compile(items)
+            self._options = (items, options)
+        return options
+
+
+class ItemsCache(LRUCache):
+
+    """A cache for the results of callable items, that can be shared by
+    many fields, or by the same field in different form instances.
+
+    :param ttl:
+        If set, the items are fetched again after these many seconds.
+
+    :param maxsize:
+        Maximum number of lists of items to keep.
+
+    :param key:
+        An optional function that takes the form and returns the key
+        used to store its items, if they depend on it (eg: by language).
+        By default, all forms share the same items.
+
+    The items are stored by the function that returns them and that key,
+    so fields with different items can share a cache.
+
+    """
+
+    def __init__(self, ttl=None, maxsize=128, key=None):
+        self.key = key
+        super(ItemsCache, self).__init__(maxsize=maxsize, ttl=ttl)
+
+    def get_key(self, form):
+        return self.key(form) if self.key else None
+
+    def get_items(self, func, form):
+        key = (func, self.get_key(form))
+        items = self.get(key)
+        if items is None:
+            items = func(form)
+            self.set(key, items)
+        return items
+
+    def invalidate_items(self, func, form):
+        self.invalidate((func, self.get_key(form)))
+
+
 class BaseSelect(Field):
 
+    __slots__ = ('_items', '_type', '_create', '_cache', '_items_key',
+                 '_items_index', '_cached_items')
+    # The items can be replaced in a bound field
+    bound_state = BOUND_STATE + ('_items', '_cached_items')
+    _option_attrs = HtmlAttrsTemplate(flag='selected')
+
+    def __init__(self, items, type=None, create=False, cache=False,
+                 items_key=None, **kwargs):
+        self._items = items
+        self._type = type
+        self._create = create
+        self._cache = cache
+        self._items_key = items_key
+        self._items_index = ItemsIndex()
+        super(BaseSelect, self).__init__(**kwargs)
+
+    def __copy__(self):
+        new = super(BaseSelect, self).__copy__()
+        new._items_index = ItemsIndex()
+        return new
+
+    def bind(self, form, name, prepare=None, clean=None):
+        bound = super(BaseSelect, self).bind(
+            form, name, prepare=prepare, clean=clean)
+        bound._items = self._items
+        bound._cached_items = None
+        return bound
+
+    @property
+    def items(self):
+        if not callable(self._items):
+            return self._items
+        if isinstance(self._cache, ItemsCache):
+            return self._cache.get_items(self._items, self.form)
+        if not self._cache:
+            return self._items(self.form)
+        items = getattr(self, '_cached_items', None)
+        if items is None:
+            items = self._items(self.form)
+            self._cached_items = items
+        return items
+
+    @items.setter
+    def items(self, items):
+        self._items = items
+        self._cached_items = None
+
+    def invalidate_items(self):
+        """Forget the cached result of callable items, so they are fetched
+        again the next time they are needed."""
+        self._cached_items = None
+        if isinstance(self._cache, ItemsCache):
+            self._cache.invalidate_items(self._items, self.form)
+
+    def reset(self):
+        super(BaseSelect, self).reset()
+        self._cached_items = None
+
+    def __iter__(self):
+        for item in self.items:
+            yield item
+
+    def is_accepted(self, value, items=None):
+        """Return whether `value` is one of the values of the items."""
+        if items is None:
+            items = self.items
+        try:
+            accepted = self._items_index.get_accepted(
+                items, self.get_items_key())
+            return value in accepted
+        except TypeError:  # unhashable value
+            return False
+
     def _clean_value(self, value):
         if not self._type:
             return value
@@ -32,29 +224,72 @@ class BaseSelect(Field):
         except (ValueError, TypeError):
             return None
 
-    def _render_optgroup(self, items, values):
-        html = []
-        label = items[0]
-        if isinstance(label, string_types):
-            label = escape(label)
-            html.append(u'<optgroup label="%s">' % (label, ))
-            items = items[1:]
-        else:
-            html.append(u'<optgroup>')
+    def get_items_key(self):
+        """Return the version of the items used to cache its rendered
+        options, or `None` to cache them by the identity of the list."""
+        if callable(self._items_key):
+            return self._items_key(self.form)
+        return self._items_key
+
+    def _iter_options(self, items, values):
+        options = self._items_index.get_options(
+            items, self._compile_options, self.get_items_key())
+        for option in options:
+            if not isinstance(option, tuple):
+                yield option
+                continue
+            val, head, tail = option
+            if head is None:
+                yield self._render_option((val, tail), values)
+            elif val in values:
+                yield head + SELECTED + tail
+            else:
+                yield head + tail
 
+    def _compile_options(self, items):
+        """Pre-render the options of `items`, as a list of either static
+        HTML or `(value, head, tail)` tuples, so the only thing left to do
+        when rendering is to add ` selected` between `head` and `tail`.
+        """
+        options = []
         for item in items:
-            html.append(self._render_option(item, values))
-        html.append(u'</optgroup>')
-        return html
+            if not isinstance(item, list):
+                options.append(self._compile_option(item))
+                continue
+            label = item[0]
+            if isinstance(label, string_types):
+                options.append(u'<optgroup label="%s">' % (escape(label), ))
+                item = item[1:]
+            else:
+                options.append(u'<optgroup>')
+            options.extend([self._compile_option(it) for it in item])
+            options.append(u'</optgroup>')
+        return options
+
+    def _compile_option(self, item):
+        val, label = item
+        # Booleans are rendered as properties and labels that aren't
+        # strings (eg: lazy translations) could change, so these options
+        # are rendered every time.
+        if isinstance(val, bool) or not isinstance(label, string_types):
+            return (val, None, label)
+        head = u'<option %s' % (self._option_attrs.render(val), )
+        return (val, head, u'>%s</option>' % (escape(label), ))
+
+    def _iter_items(self, items, attrs, values, tmpl):
+        for item in items:
+            if isinstance(item, list):
+                for html in self._render_fieldset(item, attrs, values, tmpl):
+                    yield html
+            else:
+                yield self._render_item(item, attrs, values, tmpl)
 
     def _render_option(self, item, values):
         val, label = item
-        item_attrs = {'value': val}
-        item_attrs['selected'] = (val in values or str(val) in values)
-        html_attrs = get_html_attrs(item_attrs)
+        html_attrs = self._option_attrs.render(val, val in values)
         return u'<option %s>%s</option>' % (html_attrs, escape(label))
 
-    def _render_fieldset(self, items, kwargs, values, tmpl):
+    def _render_fieldset(self, items, attrs, values, tmpl):
         html = [u'<fieldset>']
         legend = items[0]
         if isinstance(legend, string_types):
@@ -62,19 +297,26 @@ class BaseSelect(Field):
             items = items[1:]
 
         for item in items:
-            html.append(self._render_item(item, kwargs, values, tmpl))
+            html.append(self._render_item(item, attrs, values, tmpl))
         html.append(u'</fieldset>')
         return html
 
-    def _render_item(self, item, kwargs, values, tmpl):
+    def _render_item(self, item, attrs, values, tmpl):
+        """Render an item as a radio or checkbox.
+
+        :param attrs:
+            A `HtmlAttrsTemplate` with the attributes shared by all items.
+
+        :param values:
+            The `SelectedValues` of the field.
+
+        """
         val, label = item
         item_id = u'{id}-{hash}'.format(
             id=self.id,
             hash=hash(label or val or ''),
         )
-        kwargs['value'] = val
-        kwargs['checked'] = (val in values or str(val) in values)
-        html_attrs = get_html_attrs(kwargs)
+        html_attrs = attrs.render(val, val in values)
         return (
             tmpl
             .replace(u'{attrs}', html_attrs)
@@ -93,6 +335,19 @@ class Select(BaseSelect):
         - An list of tuples with the format `(value, label)`; or
         - A function that return a list of items in that format.
 
+    :param cache:
+        Only used if `items` is a function. If `True`, its result is reused
+        for the rest of the life of the form instance. It can also be an
+        `ItemsCache`, to share the result between form instances.
+        Use `invalidate_items()` to fetch the items again.
+
+    :param items_key:
+        The rendered options are cached until the list of items is replaced
+        by another one. If the items are modified in place, or depend on
+        the form (eg: translated labels), use this to pass a version of them
+        (or a function that takes the form and returns it) to cache the
+        options by.
+
     :param create:
         If False, only the values in the items are allowed as valid.
         Set to True with caution.
@@ -119,28 +374,13 @@ class Select(BaseSelect):
 
     """
 
-    def __init__(self, items, type=None, create=False, **kwargs):
-        self._items = items
-        self._type = type
-        self._create = create
-        super(Select, self).__init__(**kwargs)
-
-    @property
-    def items(self):
-        if callable(self._items):
-            return self._items(self.form)
-        return self._items
-
-    def __iter__(self):
-        for item in self.items:
-            yield item
+    __slots__ = ()
 
     def str_to_py(self, **kwargs):
         if self._create:
             return self._clean_value(self.str_value)
 
-        accepted = iter_flatten(self.items)
-        if self.str_value in accepted:
+        if self.is_accepted(self.str_value):
             return self._clean_value(self.str_value)
         return None
 
@@ -163,23 +403,28 @@ class Select(BaseSelect):
             It follows the same rules as `get_html_attrs`
 
         """
+        return Markup(u'\n'.join(self._iter_select(_items, kwargs)))
+
+    def iter_select(self, _items=None, **kwargs):
+        """Like `as_select` but yields the HTML in `Markup` chunks, to be used
+        with streaming templates or as part of a WSGI iterable.
+        The joined chunks are identical to the output of `as_select`.
+        """
+        return iter_joined(self._iter_select(_items, kwargs))
+
+    def _iter_select(self, _items, kwargs):
         attrs = self.extra.copy()
         attrs.update(kwargs)
         attrs['name'] = self.name
         if not self.optional:
             attrs['required'] = True
-        html = [u'<select %s>' % get_html_attrs(attrs)]
-        values = [self.to_string(**attrs)] or []
+        yield u'<select %s>' % get_html_attrs(attrs)
+        values = SelectedValues([self.to_string(**attrs)])
         items = _items or self.items
 
-        for item in items:
-            if isinstance(item, list):
-                html.extend(self._render_optgroup(item, values))
-            else:
-                html.append(self._render_option(item, values))
-        html.append(u'</select>')
-
-        return Markup('\n'.join(html))
+        for html in self._iter_options(items, values):
+            yield html
+        yield u'</select>'
 
     def as_radios(self, tmpl=TMPL, _items=None, **kwargs):
         """Render the field as a series of radio buttons, using the `tmpl`
@@ -193,24 +438,29 @@ class Select(BaseSelect):
             It follows the same rules as `get_html_attrs`
 
         """
+        return Markup(u'\n'.join(self._iter_radios(tmpl, _items, kwargs)))
+
+    as_radiobuttons = as_radios
+
+    def iter_radios(self, tmpl=TMPL, _items=None, **kwargs):
+        """Like `as_radios` but yields the HTML in `Markup` chunks, to be used
+        with streaming templates or as part of a WSGI iterable.
+        The joined chunks are identical to the output of `as_radios`.
+        """
+        return iter_joined(self._iter_radios(tmpl, _items, kwargs))
+
+    iter_radiobuttons = iter_radios
+
+    def _iter_radios(self, tmpl, _items, kwargs):
         attrs = self.extra.copy()
         attrs.update(kwargs)
         attrs['type'] = 'radio'
         attrs['name'] = self.name
-        html = []
         tmpl = to_unicode(tmpl)
-        values = [self.to_string(**attrs)] or []
+        values = SelectedValues([self.to_string(**attrs)])
         items = _items or self.items
-
-        for item in items:
-            if isinstance(item, list):
-                html.extend(self._render_fieldset(item, attrs, values, tmpl))
-            else:
-                html.append(self._render_item(item, attrs, values, tmpl))
-
-        return Markup('\n'.join(html))
-
-    as_radiobuttons = as_radios
+        attrs = HtmlAttrsTemplate(attrs, flag='checked')
+        return self._iter_items(items, attrs, values, tmpl)
 
 
 class MultiSelect(BaseSelect):
@@ -223,6 +473,19 @@ class MultiSelect(BaseSelect):
         - An list of tuples with the format `(value, label)`; or
         - A function that return a list of items in that format.
 
+    :param cache:
+        Only used if `items` is a function. If `True`, its result is reused
+        for the rest of the life of the form instance. It can also be an
+        `ItemsCache`, to share the result between form instances.
+        Use `invalidate_items()` to fetch the items again.
+
+    :param items_key:
+        The rendered options are cached until the list of items is replaced
+        by another one. If the items are modified in place, or depend on
+        the form (eg: translated labels), use this to pass a version of them
+        (or a function that takes the form and returns it) to cache the
+        options by.
+
     :param create:
         If False, only the values in the items are allowed as valid.
         Set to True with caution.
@@ -260,22 +523,12 @@ class MultiSelect(BaseSelect):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, items, type=None, create=False, **kwargs):
         kwargs.setdefault('default', [])
-        self._items = items
-        self._type = type
-        self._create = create
-        super(MultiSelect, self).__init__(**kwargs)
-
-    @property
-    def items(self):
-        if callable(self._items):
-            return self._items(self.form)
-        return self._items
-
-    def __iter__(self):
-        for item in self.items:
-            yield item
+        super(MultiSelect, self).__init__(
+            items, type=type, create=create, **kwargs)
 
     def as_dict(self):
         dd = Field.as_dict(self)
@@ -299,9 +552,9 @@ class MultiSelect(BaseSelect):
         if self._create:
             py_value = [self._clean_value(v) for v in self.str_value]
         else:
-            accepted = list(iter_flatten(self.items))
-            py_value = [self._clean_value(v)
-                        for v in self.str_value if v in accepted]
+            items = self.items
+            py_value = [self._clean_value(v) for v in self.str_value
+                        if self.is_accepted(v, items)]
         return py_value
 
     def __call__(self, **kwargs):
@@ -318,23 +571,28 @@ class MultiSelect(BaseSelect):
             It follows the same rules as `get_html_attrs`
 
         """
+        return Markup(u'\n'.join(self._iter_select(_items, kwargs)))
+
+    def iter_select(self, _items=None, **kwargs):
+        """Like `as_select` but yields the HTML in `Markup` chunks, to be used
+        with streaming templates or as part of a WSGI iterable.
+        The joined chunks are identical to the output of `as_select`.
+        """
+        return iter_joined(self._iter_select(_items, kwargs))
+
+    def _iter_select(self, _items, kwargs):
         attrs = self.extra.copy()
         attrs.update(kwargs)
         attrs['name'] = self.name
         if not self.optional:
             attrs['required'] = True
-        html = [u'<select %s multiple>' % get_html_attrs(attrs)]
-        values = self.to_string(**attrs) or []
+        yield u'<select %s multiple>' % get_html_attrs(attrs)
+        values = SelectedValues(self.to_string(**attrs) or [])
         items = _items or self.items
 
-        for item in items:
-            if isinstance(item, list):
-                html.extend(self._render_optgroup(item, values))
-            else:
-                html.append(self._render_option(item, values))
-        html.append(u'</select>')
-
-        return Markup('\n'.join(html))
+        for html in self._iter_options(items, values):
+            yield html
+        yield u'</select>'
 
     def as_checks(self, tmpl=TMPL, _items=None, **kwargs):
         """Render the field as a series of checkboxes, using the `tmpl`
@@ -348,20 +606,26 @@ class MultiSelect(BaseSelect):
             It follows the same rules as `get_html_attrs`
 
         """
+        return Markup(u'\n'.join(self._iter_checks(tmpl, _items, kwargs)))
+
+    as_checkboxes = as_checks
+
+    def iter_checks(self, tmpl=TMPL, _items=None, **kwargs):
+        """Like `as_checks` but yields the HTML in `Markup` chunks, to be used
+        with streaming templates or as part of a WSGI iterable.
+        The joined chunks are identical to the output of `as_checks`.
+        """
+        return iter_joined(self._iter_checks(tmpl, _items, kwargs))
+
+    iter_checkboxes = iter_checks
+
+    def _iter_checks(self, tmpl, _items, kwargs):
         attrs = self.extra.copy()
         attrs.update(kwargs)
         attrs['type'] = 'checkbox'
         attrs['name'] = self.name
-        html = []
         tmpl = to_unicode(tmpl)
-        values = self.to_string(**attrs) or []
+        values = SelectedValues(self.to_string(**attrs) or [])
         items = _items or self.items
-
-        for item in items:
-            if isinstance(item, list):
-                html.extend(self._render_fieldset(item, attrs, values, tmpl))
-            else:
-                html.append(self._render_item(item, attrs, values, tmpl))
-        return Markup('\n'.join(html))
-
-    as_checkboxes = as_checks
+        attrs = HtmlAttrsTemplate(attrs, flag='checked')
+        return self._iter_items(items, attrs, values, tmpl)
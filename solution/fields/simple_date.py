@@ -5,6 +5,7 @@ import datetime
 from .. import validators as v
 from ..utils import Markup, get_html_attrs
 from .field import ValidationError
+from .parsing import parse_date
 from .text import Text
 
 
@@ -34,6 +35,7 @@ class SimpleDate(Text):
         fields.
 
     """
+    __slots__ = ()
     _type = 'date'
     default_validator = v.IsDate
 
@@ -73,7 +75,6 @@ class SimpleDate(Text):
         if not self.str_value:
             return None
         try:
-            dt = [int(f) for f in self.str_value.split('-')]
-            return datetime.date(*dt)
+            return parse_date(self.str_value, datetime.date)
         except (ValueError, TypeError):
             raise ValidationError
@@ -1,16 +1,15 @@
 # coding=utf-8
 from __future__ import absolute_import
 import datetime
-import re
 
 import pytz
 
 from .. import validators as v
-from .._compat import string_types
-from ..utils import Markup, get_html_attrs
+from ..utils import Markup, get_html_attrs, get_timezone
 
 from .field import ValidationError
 from .field import Field
+from .parsing import parse_date, parse_time, to_utc
 
 
 class SplittedDateTime(Field):
@@ -42,11 +41,8 @@ class SplittedDateTime(Field):
         Default timezone for this field.
 
     """
+    __slots__ = ('time_format', )
     default_validator = v.IsDate
-    rx_time = re.compile(
-        '(?P<hour>[0-9]{1,2}):(?P<minute>[0-9]{1,2})(:(?P<second>[0-9]{1,2}))?\s?(?P<tt>am|pm)?',
-        re.IGNORECASE
-    )
 
     def __init__(self, time_format='%l:%M %p', **kwargs):
         kwargs.setdefault('default', None)
@@ -54,9 +50,7 @@ class SplittedDateTime(Field):
         return super(SplittedDateTime, self).__init__(**kwargs)
 
     def _get_tz(self):
-        tz = self.tz or pytz.utc
-        if tz and isinstance(tz, string_types):
-            tz = pytz.timezone(tz)
+        tz = get_timezone(self.tz) or pytz.utc
         self.tz = tz
         return tz
 
@@ -76,34 +70,18 @@ class SplittedDateTime(Field):
     def _to_utc(self, dt):
         """Takes a naive timezone with an localized value and return it formatted
         as utc."""
-        tz = self._get_tz()
-        loc_dt = tz.localize(dt)
-        return loc_dt.astimezone(pytz.utc)
+        return to_utc(dt, self._get_tz())
 
     def _str_to_datetime(self, str_value):
         """Parses a `YYYY-MM-DD` string into a datetime object."""
         try:
-            ldt = [int(f) for f in str_value.split('-')]
-            dt = datetime.datetime(*ldt)
+            return parse_date(str_value)
         except (ValueError, TypeError):
             return None
-        return dt
 
     def _str_to_time(self, str_value):
         """Parses a `hh:mm` or a `hh:mm pm` string into a time object."""
-        match = self.rx_time.match(str_value.upper())
-        if not match:
-            return None
-        try:
-            gd = match.groupdict()
-            hour = int(gd['hour'])
-            minute = int(gd['minute'])
-            second = int(gd['second'] or 0)
-            if gd['tt'] == 'PM':
-                hour += 12
-            return datetime.time(hour, minute, second)
-        except (ValueError, TypeError):
-            return None
+        return parse_time(str_value)
 
     def py_to_str(self, **kwargs):
         dt = self.obj_value or self.default
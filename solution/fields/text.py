@@ -30,6 +30,7 @@ class Text(Field):
 
     """
 
+    __slots__ = ()
     _type = 'text'
     default_validator = None
 
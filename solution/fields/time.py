@@ -1,11 +1,10 @@
 # coding=utf-8
 from __future__ import absolute_import
-import datetime
-import re
 
 from .. import validators as v
 from ..utils import Markup, get_html_attrs
 from .field import ValidationError
+from .parsing import parse_time
 from .text import Text
 
 
@@ -33,12 +32,9 @@ class Time(Text):
         Do not render the current value a a string.
 
     """
+    __slots__ = ('format', )
     _type = 'time'
     default_validator = v.IsTime
-    rx_time = re.compile(
-        '(?P<hour>[0-9]{1,2}):(?P<minute>[0-9]{1,2})(:(?P<second>[0-9]{1,2}))?\s?(?P<tt>am|pm)?',
-        re.IGNORECASE
-    )
 
     def __init__(self, format='%l:%M %p', **kwargs):
         self.format = format
@@ -76,16 +72,7 @@ class Time(Text):
     def str_to_py(self, format=None, locale=None):
         if not self.str_value:
             return None
-        match = self.rx_time.match(self.str_value.upper())
-        if not match:
-            raise ValidationError
-        try:
-            gd = match.groupdict()
-            hour = int(gd['hour'])
-            minute = int(gd['minute'])
-            second = int(gd['second'] or 0)
-            if gd['tt'] == 'PM':
-                hour += 12
-            return datetime.time(hour, minute, second)
-        except (ValueError, TypeError):
+        tt = parse_time(self.str_value)
+        if tt is None:
             raise ValidationError
+        return tt
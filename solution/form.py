@@ -2,18 +2,233 @@
 from copy import copy
 import inspect
 
-try:
-    import simplejson as json
-except ImportError:
-    import json
+import threading
 
-from ._compat import itervalues
+from ._compat import itervalues, with_metaclass
 from .fields import Field
 from .formset import FormSet
-from .utils import FakeMultiDict, get_obj_value, set_obj_value, json_serial
+from .instrumentation import get_observer, run_phase, timer
+from .serializers import BYTES_TOKENS, TEXT_TOKENS, get_serializer
+from .utils import (
+    FakeMultiDict, LRUCache, PrefixIndex, get_obj_value, set_obj_value,
+    get_timezone)
 
 
-class Form(object):
+class FormSchema(object):
+
+    """The declared structure of a form class: its fields, sub-forms and
+    form-sets, the names of the `prepare_<name>` and `clean_<name>`
+    hooks of each field and the dependencies of its form validators.
+
+    Any attributes which begin with an underscore or are not `Field`,
+    `Form` or `FormSet` instances (or `Form` subclasses) are ignored.
+    """
+
+    def __init__(self, form_class):
+        attrs = {}
+        for klass in reversed(form_class.__mro__):
+            for name, value in klass.__dict__.items():
+                # Copies of the children of the bases, see `_wrap_children`
+                if isinstance(value, LazyChild) and value.inherited:
+                    continue
+                attrs[name] = value
+
+        self.fields = []
+        self.forms = []
+        self.sets = []
+        #: Names of the fields with form validators
+        self.form_validated = []
+        #: `{name: [(validator, inputs), ...]}` or `{name: None}` if the
+        #: field has its own `validate` or `validate_form`
+        self.form_validators = {}
+        #: `{input name: [names of the fields with validators that read it]}`
+        self.dependents = {}
+        #: Names of the fields with validators that could read any field
+        self.always_validated = set()
+
+        for name in sorted(attrs):
+            if name.startswith('_'):
+                continue
+            value = attrs[name]
+            if isinstance(value, LazyChild):
+                value = value.value
+            self._add(name, value, attrs)
+
+    def _add(self, name, value, attrs):
+        if isinstance(value, Field):
+            prepare = 'prepare_' + name
+            clean = 'clean_' + name
+            self.fields.append((
+                name, value,
+                prepare if prepare in attrs else None,
+                clean if clean in attrs else None,
+            ))
+            self._add_form_validators(name, value)
+        elif is_child(value):
+            if isinstance(value, FormSet):
+                self.sets.append((name, value))
+            else:
+                self.forms.append((name, value))
+
+    def extend(self, form_class, extra):
+        """Return a copy of this schema of `form_class` with the fields,
+        sub-forms and form-sets in the dict `extra` (usually assigned to
+        a form instance before calling `Form.__init__`) added, replacing
+        those with the same name."""
+        schema = FormSchema.__new__(FormSchema)
+        schema.fields = [e for e in self.fields if e[0] not in extra]
+        schema.forms = [e for e in self.forms if e[0] not in extra]
+        schema.sets = [e for e in self.sets if e[0] not in extra]
+        schema.form_validated = [
+            name for name in self.form_validated if name not in extra]
+        schema.form_validators = dict(
+            (name, validators)
+            for name, validators in self.form_validators.items()
+            if name not in extra)
+        schema.dependents = dict(
+            (input_name, [name for name in names if name not in extra])
+            for input_name, names in self.dependents.items())
+        schema.always_validated = self.always_validated.difference(extra)
+
+        hooks = set(
+            hook for name in extra for hook in ('prepare_' + name,
+                                                'clean_' + name)
+            if hasattr(form_class, hook))
+        for name in sorted(extra):
+            schema._add(name, extra[name], hooks)
+        schema.fields.sort(key=lambda entry: entry[0])
+        schema.form_validated.sort()
+        return schema
+
+    def _add_form_validators(self, name, field):
+        cls = type(field)
+        if (cls.validate is not Field.validate or
+                cls.validate_form is not Field.validate_form):
+            self.form_validated.append(name)
+            self.form_validators[name] = None
+            self.always_validated.add(name)
+            return
+        if not field.form_validators:
+            return
+
+        self.form_validated.append(name)
+        validators = []
+        for validator in field.form_validators:
+            inputs = validator.inputs
+            if inputs is None:
+                self.always_validated.add(name)
+            else:
+                inputs = frozenset(inputs)
+                for input_name in inputs:
+                    self.dependents.setdefault(input_name, []).append(name)
+            validators.append((validator, inputs))
+        self.form_validators[name] = validators
+
+    def get_affected(self, names, unknown=True):
+        """Return the names of the fields with form validators that read
+        any of the fields in `names`. If `unknown` is False, the fields
+        with validators that could read any field aren't included."""
+        affected = set(self.always_validated) if unknown else set()
+        for name in names:
+            affected.update(self.dependents.get(name, ()))
+        return [name for name in self.form_validated if name in affected]
+
+
+_pools = threading.local()
+
+#: Maximum number of pools (form classes and arguments) kept by thread.
+#: The least recently used are discarded first.
+MAX_POOLS = 64
+
+
+def get_pool(form_class, key):
+    """Return the list of released instances of `form_class`, created with
+    the arguments `key`, of the current thread."""
+    pools = getattr(_pools, 'pools', None)
+    if pools is None:
+        pools = _pools.pools = LRUCache(maxsize=MAX_POOLS)
+    key = (form_class, key)
+    pool = pools.get(key)
+    if pool is None:
+        pool = []
+        pools.set(key, pool)
+    return pool
+
+
+class LazyChild(object):
+
+    """Wraps a sub-form or form-set declared in a lazy form class, so it's
+    built the first time it's accessed in an instance (see `Form._lazy`).
+    In the class, it's the declared value.
+    """
+
+    def __init__(self, name, value, inherited=False):
+        self.name = name
+        self.value = value
+        #: If the child is declared in a base class instead
+        self.inherited = inherited
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self.value
+        obj._build(self.name)
+        return obj.__dict__.get(self.name, self.value)
+
+
+def is_child(value):
+    """Return whether `value` can be declared as a sub-form or form-set."""
+    return isinstance(value, (Form, FormSet)) or (
+        inspect.isclass(value) and issubclass(value, Form))
+
+
+class FormMeta(type):
+
+    """Metaclass of `Form`. Keeps the compiled `FormSchema` of each form
+    class, so it is only built once instead of on every instantiation.
+    """
+    #: Incremented each time a public attribute of any form class changes,
+    #: so the schemas of the subclasses are also rebuilt.
+    _generation = 0
+
+    def __setattr__(cls, name, value):
+        super(FormMeta, cls).__setattr__(name, value)
+        if not name.startswith('_'):
+            FormMeta._generation += 1
+
+    def __delattr__(cls, name):
+        super(FormMeta, cls).__delattr__(name)
+        if not name.startswith('_'):
+            FormMeta._generation += 1
+
+    def _get_schema(cls):
+        cached = cls.__dict__.get('_schema')
+        if cached is not None and cached[0] == FormMeta._generation:
+            return cached[1]
+        schema = FormSchema(cls)
+        type.__setattr__(cls, '_schema', (FormMeta._generation, schema))
+        if cls._lazy:
+            cls._wrap_children()
+        return schema
+
+    def _wrap_children(cls):
+        """Replace the sub-forms and form-sets of this class, including
+        the inherited ones, with `LazyChild`s. The base classes are not
+        changed."""
+        schema = cls.__dict__['_schema'][1]
+        children = dict(schema.forms + schema.sets)
+        for name, value in list(cls.__dict__.items()):
+            if (isinstance(value, LazyChild) and value.inherited and
+                    name not in children):
+                type.__delattr__(cls, name)
+        for name, value in children.items():
+            current = cls.__dict__.get(name)
+            if isinstance(current, LazyChild) and current.value is value:
+                continue
+            inherited = current is not value
+            type.__setattr__(cls, name, LazyChild(name, value, inherited))
+
+
+class Form(with_metaclass(FormMeta, object)):
 
     """Declarative Form base class. Provides core behaviour like field
     construction, validation, and data and error proxying.
@@ -43,6 +258,16 @@ class Form(object):
     :param backref:
         .
 
+    :param observer:
+        An `instrumentation.Observer` to report the timings of this form
+        to. By default, the one of the current `observe()` block, if any.
+
+    Set `_lazy = True` in a form class to postpone building its sub-forms
+    and form-sets until they are accessed, or needed by `is_valid`, `save`,
+    `as_dict` or `reset`. Until then, `has_input_data` is true if any
+    data key starts with the prefix of a sub-form or form-set not built
+    yet, even if it isn't the name of one of their fields.
+
     """
     _model = None
     _fields = None
@@ -52,31 +277,34 @@ class Form(object):
     _named_errors = None
 
     _input_data = None
+    _observer = None
+    _lazy = False
+    _pending = None
+    _declared = ()
+    #: Maximum number of released instances kept by thread (see `acquire`)
+    _pool_size = 16
+    _pool_key = None
+    _data_loaded = False
+    #: The `FormSchema` the fields of this instance were created from
+    _form_schema = None
+    #: The results of the last validation of each field, reused by
+    #: `is_valid(incremental=True)` for the fields that haven't changed.
+    _results = None
+    _form_results = None
 
     cleaned_data = None
     changed_fields = None
 
     def __init__(self, data=None, obj=None, files=None, locale='en', tz='utc',
-                 prefix=u'', backref=None, parent=None):
+                 prefix=u'', backref=None, parent=None, observer=None,
+                 _index=None):
 
         backref = backref or parent
         if self._model is not None:
             assert inspect.isclass(self._model)
 
-        data = data or {}
-        if not hasattr(data, 'getlist'):
-            data = FakeMultiDict(data)
-
-        files = files or {}
-        if not hasattr(files, 'getlist'):
-            files = FakeMultiDict(files)
-
-        obj = obj or {}
-        if isinstance(obj, dict):
-            obj = FakeMultiDict(obj)
-
         self._locale = locale
-        self._tz = tz
+        self._tz = get_timezone(tz)
         prefix = prefix or u''
         if prefix and not prefix.endswith(('_', '-', '.', '+', '|')):
             prefix += u'-'
@@ -86,54 +314,95 @@ class Form(object):
         self.cleaned_data = {}
         self.changed_fields = []
         self.validated = False
-        self._obj = obj
         self._errors = {}
         self._named_errors = {}
+        self._index = _index
+        if observer is None:
+            observer = get_observer()
+        if observer is not None:
+            self._observer = observer
 
-        self._init_fields()
+        run_phase(observer, self, 'init_fields', self._init_fields)
         # Even when there is no data we need this initialisation
-        self._init_data(data, obj, files)
+        self._load(data, obj, files)
 
-    def _init_fields(self):
-        """Creates the `_fields`, `_forms` asn `_sets` dicts.
+    def load_data(self, data=None, obj=None, files=None, _index=None):
+        """Load new data into this form (and its sub-forms and form-sets),
+        reusing its fields.
+
+        Only the fields whose data is different from the one they had are
+        marked as "dirty", to be validated again by
+        `is_valid(incremental=True)`.
+
+        :param obj:
+            If not provided, the current object of the form is kept.
 
-        Any properties which begin with an underscore or are not `Field`,
-        `Form` or `FormSet` **instances** are ignored by this method.
         """
-        fields = {}
-        forms = {}
-        sets = {}
+        if obj is None:
+            obj = self._obj
+        self._index = _index
+        self.validated = False
+        self._load(data, obj, files)
 
-        for name in dir(self):
-            if name.startswith('_'):
-                continue
-            field = getattr(self, name)
-            is_field = isinstance(field, Field)
-            is_form = isinstance(field, Form) or (
-                inspect.isclass(field) and issubclass(field, Form))
-            is_set = isinstance(field, FormSet)
+    def _load(self, data, obj, files):
+        data = data or {}
+        if not hasattr(data, 'getlist'):
+            data = FakeMultiDict(data)
+
+        files = files or {}
+        if not hasattr(files, 'getlist'):
+            files = FakeMultiDict(files)
+
+        obj = obj or {}
+        if isinstance(obj, dict):
+            obj = FakeMultiDict(obj)
+
+        self._obj = obj
+        run_phase(self._observer, self, 'init_data', self._init_data,
+                  data, obj, files)
+
+    def _init_fields(self):
+        """Creates the `_fields`, `_forms` and `_sets` dicts from the
+        schema of the form class (see `FormSchema`).
+        """
+        schema = self.__class__._get_schema()
+        # Fields, sub-forms and form-sets assigned to the instance
+        # before calling `__init__`
+        extra = dict(
+            (name, value) for name, value in self.__dict__.items()
+            if not name.startswith('_') and
+            (isinstance(value, Field) or is_child(value))
+        )
+        if extra:
+            schema = schema.extend(self.__class__, extra)
+        self._form_schema = schema
+        fields = {}
 
-            if is_field:
+        for name, field, prepare, clean in schema.fields:
+            prepare = getattr(self, prepare) if prepare else None
+            clean = getattr(self, clean) if clean else None
+            if name in extra:
+                # Usually a new definition for each instance, so it's
+                # copied instead of binding it
                 field = copy(field)
                 field.name = self._prefix + name
                 field.form = self
-                if field.prepare is None:
-                    field.prepare = getattr(self, 'prepare_' + name, None)
-                if field.clean is None:
-                    field.clean = getattr(self, 'clean_' + name, None)
-                fields[name] = field
-                setattr(self, name, field)
-            elif is_form:
-                forms[name] = field
-            elif is_set:
-                field._name = self._prefix + name  # REALLY IMPORTANT
-                sets[name] = field
+                field.prepare = field.prepare or prepare
+                field.clean = field.clean or clean
+            else:
+                field = field.bind(
+                    self, self._prefix + name, prepare=prepare, clean=clean)
+            fields[name] = field
+            setattr(self, name, field)
 
         self._fields = fields
-        self._forms = forms
-        self._sets = sets
+        self._forms = dict(schema.forms)
+        self._sets = dict(schema.sets)
+        # Names of the sub-forms and form-sets not built yet
+        self._declared = set(self._forms) | set(self._sets)
 
     def as_dict(self):
+        self._build()
         dd = {
             field.name: field.as_dict()
             for field in self._fields.values()
@@ -147,14 +416,76 @@ class Form(object):
             for name, formset in self._sets.items()
         })
         dd.update({
-            '_{}_form'.format(name): formset.form.as_dict()
+            '_{}_form'.format(name): formset.get_template().as_dict()
             for name, formset in self._sets.items()
         })
         return dd
 
-    def as_json(self):
-        """Useful for inserting the form data as a JavaScript object."""
-        return json.dumps(self.as_dict(), default=json_serial)
+    def as_json(self, bytes=False, serializer=None):
+        """Useful for inserting the form data as a JavaScript object.
+
+        :param bytes:
+            Return UTF-8 bytes instead of text, ready to be sent. Faster
+            than encoding the text with backends like orjson.
+
+        :param serializer:
+            The name of the JSON backend to use (see `serializers`). By
+            default, the fastest one installed.
+        """
+        tokens = BYTES_TOKENS if bytes else TEXT_TOKENS
+        return tokens.empty.join(
+            self.iter_json(bytes=bytes, serializer=serializer))
+
+    def iter_json(self, bytes=False, serializer=None):
+        """Yield the JSON of `as_dict()` in chunks, without building the
+        dicts of the sub-forms and form-sets first. See `as_json()` for
+        the arguments."""
+        return self._iter_json(get_serializer(serializer), bytes)
+
+    def _iter_json(self, serializer, bytes):
+        encode = serializer.dumpb if bytes else serializer.dumps
+        tokens = serializer.get_tokens(bytes)
+        if self._overrides_as_dict():
+            yield encode(self.as_dict())
+            return
+        self._build()
+        fields = self._encode_fields(encode)
+        if not self._forms and not self._sets:
+            yield fields
+            return
+        yield fields[:-1]
+        sep = tokens.comma if self._fields else tokens.empty
+        for name, form in self._forms.items():
+            yield sep + encode(name) + tokens.colon
+            for chunk in form._iter_json(serializer, bytes):
+                yield chunk
+            sep = tokens.comma
+        for name, formset in self._sets.items():
+            yield sep + encode(name) + tokens.colon
+            for chunk in formset._iter_json(serializer, bytes):
+                yield chunk
+            sep = tokens.comma
+        for name, formset in self._sets.items():
+            yield sep + encode('_{}_form'.format(name)) + tokens.colon
+            yield formset.get_template().as_json(bytes, serializer)
+            sep = tokens.comma
+        yield tokens.close
+
+    def _overrides_as_dict(self):
+        """Return whether the class of this form has its own `as_dict`,
+        that must be used to make its JSON."""
+        return type(self).as_dict is not Form.as_dict
+
+    def _encode_fields(self, encode):
+        """The fields of a single form are encoded in one go."""
+        return encode(dict(
+            (field.name, field.as_dict()) for field in self._fields.values()))
+
+    def dump_json(self, fp, bytes=False, serializer=None):
+        """Write the JSON of the form to the file-like object `fp`, as text
+        or, if `bytes` is true, as UTF-8 bytes."""
+        for chunk in self.iter_json(bytes, serializer):
+            fp.write(chunk)
 
     def prepare(self, data):
         """You can overwrite this method to store the logic of pre-processing
@@ -174,55 +505,46 @@ class Form(object):
         """Load the data into the form.
         """
         data = self.prepare(data)
+        # Shared with the sub-forms and form-sets
+        index = PrefixIndex.get(self._index, data, files)
+        self._index = index
+        # Reloading data into a form that already had some (see `load_data`)
+        reload = self._data_loaded
+        self._data_loaded = True
+        self._input_data = None
+
+        pending = self._pending = {} if self._lazy else None
 
         # Initialize sub-forms
         for name, subform in self._forms.items():
             obj_value = get_obj_value(obj, name)
-            if inspect.isclass(subform):
-                fclass = subform
-            else:
-                fclass = subform.__class__
-            subform_prefix = '{prefix}{name}.'.format(
-                prefix=self._prefix,
-                name=name.lower()
-            )
-            subform = fclass(
-                data,
-                obj_value,
-                files=files,
-                locale=self._locale,
-                tz=self._tz,
-                prefix=subform_prefix,
-                backref=getattr(subform, '_backref', None)
-            )
-
-            self._forms[name] = subform
-            setattr(self, name, subform)
-            self._input_data = self._input_data or subform._input_data
+            if name not in self._declared:
+                subform.load_data(data, obj_value, files=files, _index=index)
+                self._input_data = (
+                    self._input_data or subform.has_input_data)
+                continue
+            args = (name, data, obj_value, files, index)
+            if pending is not None:
+                prefix = self._get_subform_prefix(name)
+                pending[name] = (self._init_subform, args, prefix in index)
+                continue
+            self._init_subform(*args)
 
         # Initialize form-sets
         for name, formset in self._sets.items():
-            sclass = formset.__class__
-            objs = formset._objs or get_obj_value(obj, name)
-            formset_name = '{prefix}{name}'.format(
-                prefix=self._prefix,
-                name=name.lower()
-            )
-            formset = sclass(
-                form_class=formset._form_class,
-                name=formset_name,
-                data=data,
-                objs=objs,
-                files=files,
-                locale=self._locale,
-                tz=self._tz,
-                create_new=formset._create_new,
-                backref=formset._backref
-            )
-            self._sets[name] = formset
-            setattr(self, name, formset)
-            for _form in formset._forms:
-                self._input_data = self._input_data or _form._input_data
+            if name not in self._declared:
+                objs = get_obj_value(obj, name) or formset._objs
+                formset.load_data(data, objs, files=files, _index=index)
+                for _form in formset._forms:
+                    self._input_data = (
+                        self._input_data or _form.has_input_data)
+                continue
+            args = (name, data, obj, files, index)
+            if pending is not None:
+                prefix = self._get_formset_name(name) + '.'
+                pending[name] = (self._init_formset, args, prefix in index)
+                continue
+            self._init_formset(*args)
 
         # Initialize fields
         for name, field in self._fields.items():
@@ -238,8 +560,151 @@ class Form(object):
             # delete field data
             if was_deleted:
                 field._deleted = True
+            elif reload and hasattr(field, '_deleted'):
+                del field._deleted
+                field.dirty = True
+
+    def _get_subform_prefix(self, name):
+        return '{prefix}{name}.'.format(prefix=self._prefix, name=name.lower())
+
+    def _get_formset_name(self, name):
+        return '{prefix}{name}'.format(prefix=self._prefix, name=name.lower())
+
+    def _init_subform(self, name, data, obj_value, files, index):
+        subform = self._forms[name]
+        self._declared.discard(name)
+        if inspect.isclass(subform):
+            fclass = subform
+        else:
+            fclass = subform.__class__
+        subform = fclass(
+            data,
+            obj_value,
+            files=files,
+            locale=self._locale,
+            tz=self._tz,
+            prefix=self._get_subform_prefix(name),
+            backref=getattr(subform, '_backref', None),
+            observer=self._observer,
+            _index=index
+        )
+
+        self._forms[name] = subform
+        setattr(self, name, subform)
+        self._input_data = self._input_data or subform.has_input_data
+
+    def _init_formset(self, name, data, obj, files, index):
+        formset = self._sets[name]
+        self._declared.discard(name)
+        sclass = formset.__class__
+        objs = formset._objs or get_obj_value(obj, name)
+        formset = sclass(
+            form_class=formset._form_class,
+            name=self._get_formset_name(name),
+            data=data,
+            objs=objs,
+            files=files,
+            locale=self._locale,
+            tz=self._tz,
+            create_new=formset._create_new,
+            backref=formset._backref,
+            observer=self._observer,
+            _index=index
+        )
+        self._sets[name] = formset
+        setattr(self, name, formset)
+        for _form in formset._forms:
+            self._input_data = self._input_data or _form.has_input_data
+
+    def _build(self, name=None):
+        """Build the sub-form or form-set `name` (or all of them) if its
+        creation has been postponed (see `_lazy`)."""
+        pending = self._pending
+        if not pending:
+            return
+        names = [name] if name is not None else list(pending)
+        for name in names:
+            if name in pending:
+                func, args, _ = pending.pop(name)
+                func(*args)
+
+    @classmethod
+    def acquire(cls, data=None, obj=None, files=None, **kwargs):
+        """Return an instance of this form class loaded with this data,
+        reusing one from the pool of released instances of this thread,
+        if there is one created with the same arguments.
+        Call `release()` when you're done with it.
+        """
+        observer = kwargs.pop('observer', None)
+        if observer is None:
+            observer = get_observer()
+        try:
+            key = tuple(sorted(kwargs.items()))
+            hash(key)
+        except TypeError:  # unhashable arguments
+            return cls(data, obj, files, observer=observer, **kwargs)
+
+        pool = get_pool(cls, key)
+        if pool:
+            form = pool.pop()
+            form._set_observer(observer)
+            form.load_data(data, obj or {}, files)
+        else:
+            form = cls(data, obj, files, observer=observer, **kwargs)
+            form._pool_key = key
+        return form
+
+    def release(self):
+        """Reset this form and return it to the pool of its class, to be
+        reused by `acquire`. Don't use the form after calling this.
+        """
+        key = self._pool_key
+        if key is None:
+            return
+        pool = get_pool(self.__class__, key)
+        if len(pool) >= self._pool_size or any(f is self for f in pool):
+            return
+        self.reset()
+        # Don't keep the objects and the observer alive while in the pool
+        self._forget()
+        pool.append(self)
+
+    def _set_observer(self, observer):
+        if self._observer is observer:
+            return
+        self._observer = observer
+        for name, subform in self._forms.items():
+            if name not in self._declared:
+                subform._set_observer(observer)
+        for name, formset in self._sets.items():
+            if name not in self._declared:
+                formset._observer = observer
+                for form in formset._forms:
+                    form._set_observer(observer)
+
+    def _forget(self):
+        self._obj = None
+        self._index = None
+        self._set_observer(None)
+        for name, subform in self._forms.items():
+            if name not in self._declared:
+                subform._forget()
+        for name, formset in self._sets.items():
+            if name not in self._declared:
+                formset._index = None
+                for form in formset._forms:
+                    form._forget()
 
     def reset(self):
+        self._build()
+        self._results = None
+        self._form_results = None
+        self.cleaned_data = {}
+        self.changed_fields = []
+        self.validated = False
+        self._errors = {}
+        self._named_errors = {}
+        self._input_data = None
         for subform in self._forms.values():
             subform.reset()
         for formset in self._sets.values():
@@ -260,15 +725,31 @@ class Form(object):
 
     @property
     def has_input_data(self):
-        return bool(self._input_data)
+        if self._input_data:
+            return True
+        # Guessed from the prefixes of the sub-forms and form-sets not
+        # built yet (see `_lazy`)
+        pending = self._pending
+        return bool(pending) and any(
+            has_data for _, _, has_data in pending.values())
 
     @property
     def has_changed(self):
         return len(self.changed_fields) > 0
 
-    def is_valid(self):
+    def is_valid(self, incremental=False):
         """Return whether the current values of the form fields are all valid.
+
+        :param incremental:
+            If the form has been validated before, only validate again the
+            fields that have changed since then (see `load_data`) and reuse
+            the previous results of the rest. The same goes for the sub-forms
+            and the rows of the form-sets. The form validators and `clean`
+            are always called.
+
         """
+        self._build()
+        incremental = incremental and self._results is not None
         self.cleaned_data = {}
         self.changed_fields = []
         self.validated = False
@@ -278,10 +759,30 @@ class Form(object):
         changed_fields = []
         errors = {}
         named_errors = {}
+        observer = self._observer
+
+        validated = run_phase(
+            observer, self, 'validate_fields', self._validate_fields,
+            cleaned_data, changed_fields, errors, named_errors, incremental)
+        run_phase(observer, self, 'validate_form', self._validate_form,
+                  cleaned_data, errors, named_errors, validated)
+
+        if errors:
+            self._errors = errors
+            self._named_errors = named_errors
+            return False
+
+        self.changed_fields = changed_fields
+        self.cleaned_data = run_phase(
+            observer, self, 'clean', self.clean, cleaned_data)
+        self.validated = True
+        return True
 
+    def _validate_fields(self, cleaned_data, changed_fields, errors,
+                         named_errors, incremental=False):
         # Validate sub forms
         for name, subform in self._forms.items():
-            if not subform.is_valid():
+            if not subform.is_valid(incremental=incremental):
                 errors[name] = subform._errors
                 named_errors.update(subform._named_errors)
                 continue
@@ -290,7 +791,7 @@ class Form(object):
 
         # Validate sub sets
         for name, formset in self._sets.items():
-            if not formset.is_valid():
+            if not formset.is_valid(incremental=incremental):
                 errors[name] = formset._errors
                 named_errors.update(formset._named_errors)
                 continue
@@ -298,9 +799,18 @@ class Form(object):
                 changed_fields.append(name)
 
         # Validate each field
+        results = self._results if incremental else {}
+        validated = []
         for name, field in self._fields.items():
-            field.error = None
-            py_value = field.validate(self)
+            if incremental and not field.dirty:
+                py_value, field.error = results[name]
+            else:
+                field.error = None
+                py_value = self._run_field(
+                    name, 'validate_field', field.validate, self)
+                results[name] = (py_value, field.error)
+                field.dirty = False
+                validated.append(name)
             if field.error:
                 errors[name] = field.error
                 named_errors[field.name] = field.error
@@ -311,29 +821,172 @@ class Form(object):
                 field.has_changed = True
             if field.has_changed:
                 changed_fields.append(name)
+        self._results = results
+        return None if not incremental else validated
 
-        # Validate relation between fields
-        for name, field in self._fields.items():
-            field.validate(self, cleaned_data)
+    def _validate_form(self, cleaned_data, errors, named_errors,
+                       validated=None):
+        """Validate relation between fields.
+
+        Only the fields with form validators are checked, and their
+        validators are skipped if any of the fields they read is invalid.
+        If `validated` is a list of the fields that have just been validated
+        again, only the validators that read them are called and the
+        previous results of the rest are reused.
+        """
+        schema = self._form_schema
+        invalid = frozenset(errors)
+        if validated is None or self._form_results is None:
+            names = schema.form_validated
+            results = {}
+        else:
+            names = schema.get_affected(validated)
+            results = self._form_results
+            for name, error in results.items():
+                if error is None or name in names:
+                    continue
+                field = self._fields[name]
+                field.error = error
+                errors[name] = error
+                named_errors[field.name] = error
+
+        for name in names:
+            field = self._fields[name]
+            validators = schema.form_validators[name]
+            field_error = field.error
+            if validators is None:
+                self._run_field(name, 'validate_form', field.validate,
+                                self, cleaned_data)
+            else:
+                validators = [
+                    validator for validator, inputs in validators
+                    if inputs is None or not (inputs & invalid)
+                ]
+                if validators:
+                    self._run_field(name, 'validate_form', field.validate_form,
+                                    self, cleaned_data, validators)
+            results[name] = None
+            if field.error is not field_error:
+                results[name] = field.error
             if field.error:
                 errors[name] = field.error
                 named_errors[field.name] = field.error
+        self._form_results = results
+
+    def validate_fields(self, names):
+        """Validate only the fields in `names`, and the form validators that
+        read them, without touching the rest of the form. Useful to validate
+        a field as the user types.
+
+        The fields of sub-forms and rows of form-sets can be included using
+        dotted paths, like `address.city` or `phones.2.number` (rows are
+        1-based).
+
+        Form validators that could read any field (without `inputs`) are
+        not called.
+
+        Paths that don't match any field of the form, like those of
+        unknown fields or rows, are ignored.
+
+        Return a dict `{path: ValidationError}` of the invalid fields,
+        including those with a form validator that failed.
+        """
+        errors = {}
+        local = []
+        nested = {}
+        for path in names:
+            name, _, rest = path.partition('.')
+            if rest:
+                nested.setdefault(name, []).append(rest)
+            else:
+                local.append(name)
+
+        for name, paths in nested.items():
+            self._build(name)
+            if name in self._forms:
+                child = self._forms[name]
+            elif name in self._sets:
+                child = self._sets[name]
+            else:
                 continue
+            for path, error in child.validate_fields(paths).items():
+                errors['{0}.{1}'.format(name, path)] = error
 
-        if errors:
-            self._errors = errors
-            self._named_errors = named_errors
-            return False
+        if local:
+            errors.update(self._validate_some(local))
+        return errors
 
-        self.changed_fields = changed_fields
-        self.cleaned_data = self.clean(cleaned_data)
-        self.validated = True
-        return True
+    def _validate_some(self, names):
+        schema = self._form_schema
+        names = frozenset(names)
+
+        # The form validators that read these fields and what else they read
+        checks = []
+        needed = set(names)
+        for owner in schema.get_affected(names, unknown=False):
+            validators = [
+                (validator, inputs)
+                for validator, inputs in schema.form_validators[owner]
+                if inputs is not None and inputs & names
+            ]
+            for _, inputs in validators:
+                needed.update(inputs)
+            checks.append((owner, validators))
+
+        cleaned_data = {}
+        invalid = set()
+        errors = {}
+        for name in needed:
+            field = self._fields.get(name)
+            if field is None:
+                continue
+            field.error = None
+            py_value = self._run_field(
+                name, 'validate_field', field.validate, self)
+            if field.error:
+                invalid.add(name)
+                if name in names:
+                    errors[name] = field.error
+                continue
+            if hasattr(field, '_deleted'):
+                py_value = None
+            cleaned_data[name] = py_value
+
+        for owner, validators in checks:
+            validators = [
+                validator for validator, inputs in validators
+                if not (inputs & invalid)
+            ]
+            if not validators:
+                continue
+            field = self._fields[owner]
+            field_error = field.error
+            self._run_field(owner, 'validate_form', field.validate_form,
+                            self, cleaned_data, validators)
+            if field.error is not field_error:
+                errors[owner] = field.error
+        return errors
+
+    def _run_field(self, name, phase, func, *args):
+        """Return `func(*args)`, reporting its duration as the `phase` of
+        the field `name` if the form has an observer."""
+        observer = self._observer
+        if observer is None:
+            return func(*args)
+        start = timer()
+        try:
+            return func(*args)
+        finally:
+            observer.on_field(self, name, phase, timer() - start)
 
     def save(self, backref_obj=None):
         """Save the cleaned data to the initial object or creating a new one
         (if a `model_class` was provided).
         """
+        return run_phase(self._observer, self, 'save', self._save, backref_obj)
+
+    def _save(self, backref_obj=None):
+        self._build()
         if not self.validated:
             assert self.is_valid()
 
@@ -1,5 +1,91 @@
 # coding=utf-8
-from .utils import FakeMultiDict, get_obj_value, set_obj_value
+from .instrumentation import get_observer, run_phase, unobserved
+from .serializers import BYTES_TOKENS, TEXT_TOKENS, get_serializer
+from .utils import (
+    FakeMultiDict, PrefixIndex, get_obj_value, set_obj_value, get_timezone)
+
+
+class FormTemplate(object):
+
+    """The empty form of the first row of a form-set, built once per form
+    class and prefix and shared by all the form-sets, with its `as_dict()`
+    and JSON memoized when they can't change (no callable defaults or
+    items). The form must be treated as read-only.
+
+    The templates of a form class are kept in its `_templates` attribute,
+    `{prefix: FormTemplate}`, so they live as long as the class.
+    """
+
+    __slots__ = ('schema', 'form', 'static', '_dict', '_json')
+
+    def __init__(self, form_class, prefix):
+        self.schema = form_class._get_schema()
+        # Shared by every request, so it must not report to the observer
+        # of the one that happens to build it
+        with unobserved():
+            self.form = form_class(prefix=prefix)
+            self.static = is_static(self.form)
+        self._dict = None
+        self._json = {}
+
+    @classmethod
+    def get(cls, form_class, prefix):
+        templates = form_class.__dict__.get('_templates')
+        if templates is None:
+            templates = {}
+            type.__setattr__(form_class, '_templates', templates)
+        template = templates.get(prefix)
+        # The form class could have changed since
+        if template is None or template.schema is not form_class._get_schema():
+            template = templates[prefix] = cls(form_class, prefix)
+        return template
+
+    def as_dict(self):
+        """Return a new `as_dict()` of the form, copied from the memoized
+        one if possible."""
+        if not self.static:
+            return self.form.as_dict()
+        if self._dict is None:
+            self._dict = self.form.as_dict()
+        return copy_dict(self._dict)
+
+    def as_json(self, bytes=False, serializer=None):
+        serializer = get_serializer(serializer)
+        if not self.static:
+            return self.form.as_json(bytes, serializer)
+        key = (serializer.name, bytes)
+        json = self._json.get(key)
+        if json is None:
+            encode = serializer.dumpb if bytes else serializer.dumps
+            json = self._json[key] = encode(self.as_dict())
+        return json
+
+
+def copy_dict(value):
+    """Copy the dicts and lists of an `as_dict()`, and not its values."""
+    if isinstance(value, dict):
+        return dict((key, copy_dict(val)) for key, val in value.items())
+    if isinstance(value, list):
+        return [copy_dict(val) for val in value]
+    return value
+
+
+def is_static(form):
+    """Return whether the `as_dict()` of the empty `form` is always the
+    same."""
+    form._build()
+    for field in form._fields.values():
+        if callable(field._default) or callable(
+                getattr(field, '_items', None)):
+            return False
+    for subform in form._forms.values():
+        if not is_static(subform):
+            return False
+    for formset in form._sets.values():
+        if not FormTemplate.get(
+                formset._form_class, formset._get_fullname(1)).static:
+            return False
+    return True
 
 
 class FormSet(object):
@@ -23,35 +109,68 @@ class FormSet(object):
         Used to pass files coming from the enduser, usually `request.files`,
         or equivalent.
 
+    :param observer:
+        An `instrumentation.Observer` to report the timings of this form-set
+        and its forms to. By default, the one of the current `observe()`
+        block, if any.
+
     """
     _forms = None
     _errors = None
     _named_errors = None
     missing_objs = None
     has_changed = False
+    _observer = None
 
     def __init__(
             self, form_class, data=None, objs=None, files=None,
             locale='en', tz='utc', create_new=True, name='',
-            backref=None, parent=None):
+            backref=None, parent=None, observer=None, _index=None):
         self._form_class = form_class
         self._locale = locale
-        self._tz = tz
+        self._tz = get_timezone(tz)
         self._name = name
         self._create_new = bool(create_new)
         backref = backref or parent
         self._backref = backref
         self._forms = []
+        #: `{prefix: form}` of the rows, reused by `load_data`
+        self._rows = {}
         self._errors = {}
         self._named_errors = {}
         self.missing_objs = []
         self.has_changed = False
         self._objs = objs
+        self._index = _index
+        if observer is None:
+            observer = get_observer()
+        if observer is not None:
+            self._observer = observer
 
         if (data or objs or files):
-            self._init(data, objs, files)
+            run_phase(observer, self, 'init', self._init, data, objs, files)
+
+    def load_data(self, data=None, objs=None, files=None, _index=None):
+        """Load new data into this set. The forms of the rows that already
+        exist are reused (see `Form.load_data`), so only what has changed
+        is validated again by `is_valid(incremental=True)`.
+
+        :param objs:
+            If not provided, the current objects of the set are kept.
+
+        """
+        if objs is not None:
+            self._objs = objs
+        self._index = _index
+        run_phase(self._observer, self, 'init', self._init,
+                  data, self._objs, files)
 
     def reset(self):
+        self._objs = None
+        self._errors = {}
+        self._named_errors = {}
+        self.missing_objs = []
+        self.has_changed = False
         # Reset sub-forms
         for subform in self._forms:
             subform.reset()
@@ -69,8 +188,14 @@ class FormSet(object):
 
     @property
     def form(self):
+        """A new empty form of the first row. To render it without building
+        it every time, use `get_template()` instead."""
         return self.get_empty_form(1)
 
+    def get_template(self):
+        """Return the `FormTemplate` of the empty form of the first row."""
+        return FormTemplate.get(self._form_class, self._get_fullname(1))
+
     def get_form(self, index):
         """Returns the n-index form, where index is 1-based.
         the form'll be filled with data if it exists or empty if not
@@ -101,6 +226,11 @@ class FormSet(object):
             iter(objs)
         except TypeError:
             objs = [objs]
+        index = PrefixIndex.get(self._index, data, files)
+        self._index = index
+        # The forms of the rows to reuse, by name
+        rows = self._rows
+        self._rows = {}
 
         forms = []
         missing_objs = []
@@ -113,18 +243,14 @@ class FormSet(object):
                 missing_objs.append(obj)
                 continue
 
-            f = self._form_class(
-                data, obj=obj, files=files,
-                locale=self._locale, tz=self._tz,
-                prefix=fullname, backref=self._backref
-            )
-            forms.append(f)
+            forms.append(self._get_row_form(
+                fullname, rows, data, obj, files, index))
         num += 1
 
         if data and self._create_new:
             forms = self._find_new_forms(
                 forms, num, data, files,
-                locale=self._locale, tz=self._tz
+                locale=self._locale, tz=self._tz, index=index, rows=rows
             )
 
         self._forms = forms
@@ -145,27 +271,88 @@ class FormSet(object):
     def as_dict(self):
         return [form.as_dict() for form in self._forms]
 
+    def as_json(self, bytes=False, serializer=None):
+        """See `Form.as_json()`."""
+        tokens = BYTES_TOKENS if bytes else TEXT_TOKENS
+        return tokens.empty.join(
+            self.iter_json(bytes=bytes, serializer=serializer))
+
+    def iter_json(self, bytes=False, serializer=None):
+        """Yield the JSON of `as_dict()` in chunks, one form at a time."""
+        return self._iter_json(get_serializer(serializer), bytes)
+
+    def _iter_json(self, serializer, bytes):
+        encode = serializer.dumpb if bytes else serializer.dumps
+        tokens = serializer.get_tokens(bytes)
+        if type(self).as_dict is not FormSet.as_dict:
+            yield encode(self.as_dict())
+            return
+        yield tokens.open_list
+        sep = tokens.empty
+        for form in self._forms:
+            form._build()
+            if form._forms or form._sets or form._overrides_as_dict():
+                yield sep
+                for chunk in form._iter_json(serializer, bytes):
+                    yield chunk
+            else:
+                yield sep + form._encode_fields(encode)
+            sep = tokens.comma
+        yield tokens.close_list
+
+    def dump_json(self, fp, bytes=False, serializer=None):
+        """Write the JSON of the form-set to the file-like object `fp`."""
+        for chunk in self.iter_json(bytes, serializer):
+            fp.write(chunk)
+
     def _get_fullname(self, num):
         return '{name}.{num}'.format(
             name=self._name or self._form_class.__name__.lower(),
             num=num
         )
 
-    def _find_new_forms(self, forms, num, data, files, locale, tz):
+    def _get_row_form(self, fullname, rows, data, obj, files, index):
+        """Return the form of a row, reusing the one it had if any.
+        """
+        form = rows.get(fullname)
+        if form is not None:
+            form.load_data(data, obj=obj, files=files, _index=index)
+        else:
+            form = self._form_class(
+                data, obj=obj, files=files,
+                locale=self._locale, tz=self._tz,
+                prefix=fullname, backref=self._backref,
+                observer=self._observer, _index=index
+            )
+        self._rows[fullname] = form
+        return form
+
+    def _find_new_forms(self, forms, num, data, files, locale, tz,
+                        index=None, rows=None):
         """Acknowledge new forms created client-side.
         """
+        index = PrefixIndex.get(index, data, files)
+        rows = rows or {}
         fullname = self._get_fullname(num)
-        while has_data(data, fullname) or has_data(files, fullname):
-            f = self._form_class(
-                data, files=files, locale=locale, tz=tz,
-                prefix=fullname, backref=self._backref
-            )
-            forms.append(f)
+        while fullname + '-' in index:
+            forms.append(self._get_row_form(
+                fullname, rows, data, None, files, index))
             num += 1
             fullname = self._get_fullname(num)
         return forms
 
-    def is_valid(self):
+    def is_valid(self, incremental=False):
+        """Return whether all the forms with input data are valid.
+
+        :param incremental:
+            Only validate again what has changed in each form since they
+            were last validated. See `Form.is_valid`.
+
+        """
+        return run_phase(self._observer, self, 'is_valid', self._is_valid,
+                         incremental)
+
+    def _is_valid(self, incremental=False):
         self._errors = {}
         self._named_errors = {}
         self.has_changed = False
@@ -177,7 +364,7 @@ class FormSet(object):
                 self.has_changed = True
                 continue
             else:
-                if not form.is_valid():
+                if not form.is_valid(incremental=incremental):
                     errors[name] = form._errors
                     named_errors.update(form._named_errors)
                     continue
@@ -189,23 +376,32 @@ class FormSet(object):
             return False
         return True
 
+    def validate_fields(self, paths):
+        """Validate only some fields of some rows, given as `num.name` paths
+        (`num` is 1-based). See `Form.validate_fields`.
+        """
+        errors = {}
+        rows = {}
+        for path in paths:
+            num, _, rest = path.partition('.')
+            if not num.isdigit() or not 0 < int(num) <= len(self._forms):
+                continue
+            rows.setdefault(int(num), []).append(rest)
+        for num, names in rows.items():
+            form = self._forms[num - 1]
+            for path, error in form.validate_fields(names).items():
+                errors['{0}.{1}'.format(num, path)] = error
+        return errors
+
     def save(self, backref_obj):
+        return run_phase(self._observer, self, 'save', self._save, backref_obj)
+
+    def _save(self, backref_obj):
         return [
             form.save(backref_obj) for form in self._forms
             if form.has_input_data
         ]
 
 
-def has_data(d, fullname):
-    """Test if any of the `keys` of the `d` dictionary starts with `fullname`.
-    """
-    fullname = r'%s-' % (fullname, )
-    for k in d:
-        if not k.startswith(fullname):
-            continue
-        return True
-    return False
-
-
 def has_been_deleted(d, fullname):
     return '{}__deleted'.format(fullname) in d
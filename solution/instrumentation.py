@@ -0,0 +1,194 @@
+# coding=utf-8
+"""
+Opt-in instrumentation of the life cycle of forms and form-sets.
+
+Forms and form-sets created inside an `observe()` block (or with an
+`observer` argument) report to that observer how long each phase took,
+how long each field took to validate and each validator that was called.
+When no observer is active, the cost is a `None` check per phase.
+
+    with observe() as stats:
+        form = MyForm(request.form)
+        form.is_valid()
+    send_to_metrics(stats.as_dict())
+
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+import threading
+from timeit import default_timer as timer
+
+
+_local = threading.local()
+
+
+class Observer(object):
+
+    """Base class of the instrumentation observers. Override the hooks
+    you're interested in; by default they do nothing.
+    """
+
+    def on_phase(self, owner, phase, elapsed):
+        """Called after a phase of a form or form-set has finished.
+
+        :param owner: the `Form` or `FormSet`.
+        :param phase: one of `init_fields`, `init_data`, `validate_fields`,
+            `validate_form`, `clean` or `save` for forms and `init`,
+            `is_valid` or `save` for form-sets. A phase includes the time
+            spent in the sub-forms and form-sets of the owner.
+        :param elapsed: duration in seconds.
+        """
+
+    def on_field(self, form, name, phase, elapsed):
+        """Called after a field of `form` has been validated.
+
+        :param name: the name of the field in the form, without prefix.
+        :param phase: `validate_field` or `validate_form`.
+        :param elapsed: duration in seconds.
+        """
+
+    def on_validator(self, field, validator, valid):
+        """Called after `validator` has checked the value of `field`."""
+
+
+class Timing(object):
+
+    """Number of calls and total and maximum duration of something."""
+
+    __slots__ = ('count', 'total', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'total': self.total,
+            'max': self.max,
+            'mean': self.mean,
+        }
+
+
+def get_owner_name(owner):
+    """`MyForm` for forms and `FormSet.MyForm` for form-sets of `MyForm`."""
+    name = owner.__class__.__name__
+    form_class = getattr(owner, '_form_class', None)
+    if form_class is not None:
+        name = '{0}.{1}'.format(name, form_class.__name__)
+    return name
+
+
+class Stats(Observer):
+
+    """An observer that aggregates what it's told by name. It can be shared
+    between threads.
+
+    :attr phases:
+        `{'MyForm.init_data': Timing, ...}`
+
+    :attr fields:
+        `{'MyForm.email.validate_field': Timing, ...}`
+
+    :attr validators:
+        `{'ValidEmail': [calls, failures], ...}`
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self.phases = defaultdict(Timing)
+            self.fields = defaultdict(Timing)
+            self.validators = defaultdict(lambda: [0, 0])
+
+    def on_phase(self, owner, phase, elapsed):
+        key = '{0}.{1}'.format(get_owner_name(owner), phase)
+        with self._lock:
+            self.phases[key].add(elapsed)
+
+    def on_field(self, form, name, phase, elapsed):
+        key = '{0}.{1}.{2}'.format(get_owner_name(form), name, phase)
+        with self._lock:
+            self.fields[key].add(elapsed)
+
+    def on_validator(self, field, validator, valid):
+        key = validator.__class__.__name__
+        with self._lock:
+            counts = self.validators[key]
+            counts[0] += 1
+            if not valid:
+                counts[1] += 1
+
+    def as_dict(self):
+        """Return the stats as plain dicts, ready to be serialized or sent
+        to a metrics system."""
+        with self._lock:
+            return {
+                'phases': dict(
+                    (key, t.as_dict()) for key, t in self.phases.items()),
+                'fields': dict(
+                    (key, t.as_dict()) for key, t in self.fields.items()),
+                'validators': dict(
+                    (key, {'calls': calls, 'failures': failures})
+                    for key, (calls, failures) in self.validators.items()),
+            }
+
+
+def get_observer():
+    """Return the observer of the innermost `observe()` block of this
+    thread, if any."""
+    return getattr(_local, 'observer', None)
+
+
+@contextmanager
+def observe(observer=None):
+    """Make the forms and form-sets created inside this block report to
+    `observer` (a new `Stats` if not given), which is also returned.
+    """
+    if observer is None:
+        observer = Stats()
+    previous = get_observer()
+    _local.observer = observer
+    try:
+        yield observer
+    finally:
+        _local.observer = previous
+
+
+@contextmanager
+def unobserved():
+    """Don't report the forms and form-sets created inside this block to
+    the observer of an enclosing `observe()` block, if any."""
+    previous = get_observer()
+    _local.observer = None
+    try:
+        yield
+    finally:
+        _local.observer = previous
+
+
+def run_phase(observer, owner, phase, func, *args):
+    """Return `func(*args)`, reporting its duration to `observer` if
+    it isn't `None`."""
+    if observer is None:
+        return func(*args)
+    start = timer()
+    try:
+        return func(*args)
+    finally:
+        observer.on_phase(owner, phase, timer() - start)
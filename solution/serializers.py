@@ -0,0 +1,157 @@
+# coding=utf-8
+"""
+JSON backends for `as_json()` and `iter_json()`.
+
+By default the fastest installed backend is used: orjson, ujson,
+simplejson or, always available, the `json` module of the standard
+library. Another one can be chosen for the whole process or per call:
+
+    from solution import serializers
+    serializers.set_default('json')
+
+    form.as_json(serializer='orjson', bytes=True)
+
+orjson encodes dates, datetimes and times natively; the rest call
+`utils.json_serial` for them. The output of every backend is valid JSON,
+but the spacing and the escaping of non-ASCII characters vary: orjson
+and ujson are compact, the others use `", "` and `": "` as separators.
+"""
+from collections import namedtuple
+import json
+
+from .utils import json_serial
+
+
+#: The literal parts of the JSON of a form, as text or bytes
+Tokens = namedtuple(
+    'Tokens', 'empty open close open_list close_list comma colon')
+TEXT_TOKENS = Tokens(u'', u'{', u'}', u'[', u']', u', ', u': ')
+BYTES_TOKENS = Tokens(b'', b'{', b'}', b'[', b']', b', ', b': ')
+COMPACT_TEXT_TOKENS = Tokens(u'', u'{', u'}', u'[', u']', u',', u':')
+COMPACT_BYTES_TOKENS = Tokens(b'', b'{', b'}', b'[', b']', b',', b':')
+
+
+class Serializer(object):
+
+    """Base class of the JSON backends. Subclasses must implement `dumps`
+    or `dumpb` and can raise `ImportError` when created if their library
+    isn't installed.
+    """
+    name = None
+    #: The tokens used to join the JSON of the parts of a form, with the
+    #: same separators as the backend
+    text_tokens = TEXT_TOKENS
+    bytes_tokens = BYTES_TOKENS
+
+    def get_tokens(self, bytes=False):
+        return self.bytes_tokens if bytes else self.text_tokens
+
+    def dumps(self, obj):
+        """Return the JSON of `obj` as text."""
+        return self.dumpb(obj).decode('utf-8')
+
+    def dumpb(self, obj):
+        """Return the JSON of `obj` as UTF-8 bytes."""
+        return self.dumps(obj).encode('utf-8')
+
+
+class StdlibSerializer(Serializer):
+
+    name = 'json'
+    module = json
+
+    def __init__(self):
+        self.dumps = self.module.JSONEncoder(default=json_serial).encode
+
+
+class SimplejsonSerializer(StdlibSerializer):
+
+    name = 'simplejson'
+
+    def __init__(self):
+        import simplejson
+        self.module = simplejson
+        super(SimplejsonSerializer, self).__init__()
+
+
+class UjsonSerializer(Serializer):
+
+    name = 'ujson'
+    text_tokens = COMPACT_TEXT_TOKENS
+    bytes_tokens = COMPACT_BYTES_TOKENS
+
+    def __init__(self):
+        import ujson
+        self._dumps = ujson.dumps
+
+    def dumps(self, obj):
+        return self._dumps(obj, default=json_serial)
+
+
+class OrjsonSerializer(Serializer):
+
+    name = 'orjson'
+    text_tokens = COMPACT_TEXT_TOKENS
+    bytes_tokens = COMPACT_BYTES_TOKENS
+
+    def __init__(self):
+        import orjson
+        self._dumps = orjson.dumps
+
+    def dumpb(self, obj):
+        # Dates, datetimes and times are encoded by orjson itself
+        return self._dumps(obj, default=json_serial)
+
+
+_registry = []
+_serializers = {}
+_default = None
+
+
+def register(serializer_class):
+    """Add a backend. The ones registered first are preferred as default.
+    """
+    _registry.append(serializer_class)
+
+
+def get_serializer(name=None):
+    """Return the backend called `name` or, if it's `None`, the default
+    one. A `Serializer` instance is returned as is. Raises `ImportError`
+    if the library of the backend isn't installed.
+    """
+    if isinstance(name, Serializer):
+        return name
+    if name is None:
+        return _default or _get_default()
+    serializer = _serializers.get(name)
+    if serializer is None:
+        for serializer_class in _registry:
+            if serializer_class.name == name:
+                serializer = _serializers[name] = serializer_class()
+                break
+        else:
+            raise ValueError('Unknown JSON serializer {0!r}'.format(name))
+    return serializer
+
+
+def _get_default():
+    global _default
+    for serializer_class in _registry:
+        try:
+            _default = get_serializer(serializer_class.name)
+            return _default
+        except ImportError:
+            continue
+
+
+def set_default(name=None):
+    """Use the backend called `name` by default. With `None`, go back to
+    the fastest one installed."""
+    global _default
+    _default = get_serializer(name) if name is not None else None
+
+
+register(OrjsonSerializer)
+register(UjsonSerializer)
+register(SimplejsonSerializer)
+register(StdlibSerializer)
@@ -1,10 +1,15 @@
 # coding=utf-8
+from bisect import bisect
+from collections import OrderedDict
 import datetime
 import re
+import threading
+from time import time
 from xml.sax.saxutils import quoteattr
 
 from markupsafe import Markup, escape_silent
-from ._compat import to_unicode, iteritems
+import pytz
+from ._compat import to_unicode, iteritems, string_types, text_type
 
 
 class FakeMultiDict(dict):
@@ -27,55 +32,279 @@ class FakeMultiDict(dict):
         return [value]
 
 
+class PrefixIndex(object):
+
+    """Index of the keys of the `data` and `files` multidicts, to test if any
+    of them starts with a prefix without scanning them all.
+
+    Only prefixes ending in one of the separators used by forms and
+    form-sets (`-`, `.`, `_`, `+` or `|`) are indexed, eg: the key
+    `addresses.2-email` makes the index contain `addresses.`,
+    `addresses.2-` and `addresses.2-email` is ignored.
+
+    The index is built the first time is queried.
+    """
+    rx_separator = re.compile(r'[-._+|]')
+
+    def __init__(self, data=None, files=None):
+        self.data = data
+        self.files = files
+        self._prefixes = None
+
+    @classmethod
+    def get(cls, index, data, files):
+        """Return `index` if was made for these `data` and `files`,
+        or a new index otherwise."""
+        if index is not None and index._is_for(data, files):
+            return index
+        return cls(data, files)
+
+    def _is_for(self, data, files):
+        # Forms replace empty data with new empty dicts,
+        # so those are considered the same.
+        return (
+            (self.data is data or not (self.data or data)) and
+            (self.files is files or not (self.files or files))
+        )
+
+    def __contains__(self, prefix):
+        if self._prefixes is None:
+            self._prefixes = self._build()
+        return prefix in self._prefixes
+
+    def _build(self):
+        prefixes = set()
+        finditer = self.rx_separator.finditer
+        for source in (self.data, self.files):
+            for key in source or ():
+                if not isinstance(key, string_types):
+                    continue
+                for match in finditer(key):
+                    prefixes.add(key[:match.end()])
+        return prefixes
+
+
+class LRUCache(object):
+
+    """A thread-safe cache that keeps up to `maxsize` values, discarding the
+    least recently used first.
+
+    :param maxsize:
+        Maximum number of values to keep.
+
+    :param ttl:
+        If set, values expire after these many seconds.
+
+    """
+    _missing = object()
+
+    def __init__(self, maxsize=128, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.pop(key, self._missing)
+            if entry is self._missing:
+                return default
+            expires, value = entry
+            if expires is not None and expires < time():
+                return default
+            self._data[key] = entry
+            return value
+
+    def set(self, key, value):
+        expires = time() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (expires, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key):
+        return self.get(key, self._missing) is not self._missing
+
+    def __len__(self):
+        return len(self._data)
+
+
 def escape(value):
     return escape_silent(to_unicode(value))
 
 
-def get_html_attrs(kwargs=None):
-    """Generate HTML attributes from the provided keyword arguments.
+#: Characters that `quoteattr` would escape.
+rx_attr_escape = re.compile(u'[&<>"\n\r\t]')
 
-    The output value is sorted by the passed keys, to provide consistent
-    output.  Because of the frequent use of the normally reserved keyword
-    `class`, `classes` is used instead. Also, all underscores are translated
-    to regular dashes.
+#: Cache of HTML attribute names, eg: `data_id` -> `data-id`.
+_attr_names = {}
 
-    Set any property with a `True` value.
 
-    >>> _get_html_attrs({'id': 'text1', 'classes': 'myclass',
-        'data_id': 1, 'checked': True})
-    u'class="myclass" data-id="1" id="text1" checked'
+def get_attr_name(key):
+    name = _attr_names.get(key)
+    if name is None:
+        if len(_attr_names) > 1000:
+            _attr_names.clear()
+        name = to_unicode(key.replace('_', '-'))
+        _attr_names[key] = name
+    return name
 
-    """
-    kwargs = kwargs or {}
+
+def quote_attr_value(value):
+    """Same as `quoteattr(Markup(value))`, but much faster for the usual
+    values: strings that don't need escaping, and integers."""
+    vtype = type(value)
+    if vtype is text_type:
+        if not rx_attr_escape.search(value):
+            return u'"' + value + u'"'
+    elif vtype is int:
+        return u'"%d"' % value
+    return quoteattr(Markup(value))
+
+
+def _get_html_attrs_lists(kwargs):
     attrs = []
     props = []
 
     classes = kwargs.get('classes', '').strip()
     if classes:
-        classes = ' '.join(re.split(r'\s+', classes))
-        classes = to_unicode(quoteattr(classes))
-        attrs.append('class=%s' % classes)
-    try:
-        del kwargs['classes']
-    except KeyError:
-        pass
+        classes = u' '.join(classes.split())
+        if rx_attr_escape.search(classes):
+            classes = to_unicode(quoteattr(classes))
+        else:
+            classes = u'"' + classes + u'"'
+        attrs.append(u'class=' + classes)
 
     for key, value in iteritems(kwargs):
-        key = key.replace('_', '-')
-        key = to_unicode(key)
+        if key == 'classes':
+            continue
+        key = get_attr_name(key)
         if isinstance(value, bool):
             if value is True:
                 props.append(key)
         else:
-            value = quoteattr(Markup(value))
-            attrs.append(u'%s=%s' % (key, value))
+            attrs.append(key + u'=' + quote_attr_value(value))
 
     attrs.sort()
     props.sort()
+    return attrs, props
+
+
+def get_html_attrs(kwargs=None):
+    """Generate HTML attributes from the provided keyword arguments.
+
+    The output value is sorted by the passed keys, to provide consistent
+    output.  Because of the frequent use of the normally reserved keyword
+    `class`, `classes` is used instead. Also, all underscores are translated
+    to regular dashes.
+
+    Set any property with a `True` value.
+
+    >>> _get_html_attrs({'id': 'text1', 'classes': 'myclass',
+        'data_id': 1, 'checked': True})
+    u'class="myclass" data-id="1" id="text1" checked'
+
+    """
+    if not kwargs:
+        return u''
+    attrs, props = _get_html_attrs_lists(kwargs)
     attrs.extend(props)
     return u' '.join(attrs)
 
 
+class HtmlAttrsTemplate(object):
+
+    """Pre-renders the HTML attributes shared by a series of elements
+    that only differ in their `value` and, optionally, in a boolean
+    property like `selected` or `checked`.
+
+    `render(value, flag)` returns the same as `get_html_attrs` would for
+    these attributes with `value=value` and `<flag>=flag` added.
+    """
+
+    def __init__(self, kwargs=None, flag=None):
+        kwargs = dict(kwargs or {})
+        kwargs.pop('value', None)
+        if flag:
+            kwargs.pop(flag, None)
+        self.kwargs = kwargs
+        self.flag = flag
+
+        attrs, props = _get_html_attrs_lists(kwargs)
+        # The position of `value` doesn't depend on the values
+        pos = bisect(attrs, u'value=')
+        before = u' '.join(attrs[:pos])
+        after = u' '.join(attrs[pos:])
+        self._prefix = before + u' value=' if before else u'value='
+        self._suffix_off = self._join_suffix(after, props)
+        if flag:
+            props_on = sorted(props + [get_attr_name(flag)])
+            self._suffix_on = self._join_suffix(after, props_on)
+        else:
+            self._suffix_on = self._suffix_off
+
+    def _join_suffix(self, after, props):
+        suffix = u' ' + after if after else u''
+        if props:
+            suffix += u' ' + u' '.join(props)
+        return suffix
+
+    def render(self, value, flag=False):
+        if isinstance(value, bool):
+            kwargs = dict(self.kwargs, value=value)
+            if self.flag:
+                kwargs[self.flag] = bool(flag)
+            return get_html_attrs(kwargs)
+        return (
+            self._prefix + quote_attr_value(value) +
+            (self._suffix_on if flag else self._suffix_off)
+        )
+
+
+def iter_joined(parts, sep=u'\n', size=100):
+    """Yields the same HTML as `Markup(sep.join(parts))` but in `Markup`
+    chunks of about `size` parts, so it can be streamed.
+    """
+    chunk = []
+    first = True
+    for part in parts:
+        if first:
+            first = False
+        else:
+            chunk.append(sep)
+        chunk.append(part)
+        if len(chunk) >= size:
+            yield Markup(u''.join(chunk))
+            chunk = []
+    if chunk:
+        yield Markup(u''.join(chunk))
+
+
+_timezones = {}
+
+
+def get_timezone(tz):
+    """Return the pytz timezone named `tz`, or `tz` itself if it isn't
+    a string. The timezones are resolved once and shared by the whole
+    process."""
+    if not isinstance(tz, string_types):
+        return tz
+    try:
+        return _timezones[tz]
+    except KeyError:
+        zone = _timezones[tz] = pytz.timezone(tz)
+        return zone
+
+
 def get_obj_value(obj, name, default=None):
     # The field name could conflict with a native method
     # if `obj` is a dictionary instance
@@ -95,6 +324,6 @@ def set_obj_value(obj, name, value):
 
 def json_serial(obj):
     """JSON serializer for objects not serializable by default json code"""
-    if isinstance(obj, datetime.date):
+    if isinstance(obj, (datetime.date, datetime.time)):
         serial = obj.isoformat()
         return serial
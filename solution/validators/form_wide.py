@@ -5,8 +5,14 @@ from .validator import Validator
 
 
 class FormValidator(Validator):
-    """Base Form Validator."""
-    pass
+    """Base Form Validator.
+
+    Subclasses should set `inputs` to the names of the fields they read,
+    so the form can skip them when one of those fields is invalid, and only
+    run them again when one of those fields changes. `None` means they
+    could read any field.
+    """
+    inputs = None
 
 
 class AreEqual(FormValidator):
@@ -34,6 +40,10 @@ class AreEqual(FormValidator):
             message = self.message % (plural,)
         self.message = message
 
+    @property
+    def inputs(self):
+        return (self.name1, self.name2)
+
     def __call__(self, data=None, form=None):
         data = data or {}
         return data.get(self.name1) == data.get(self.name2)
@@ -57,6 +67,10 @@ class AtLeastOne(FormValidator):
         if message is not None:
             self.message = message
 
+    @property
+    def inputs(self):
+        return tuple(self.fields)
+
     def __call__(self, data=None, form=None):
         data = data or {}
         for field in self.fields:
@@ -91,6 +105,12 @@ class ValidSplitDate(FormValidator):
         if message is not None:
             self.message = message
 
+    @property
+    def inputs(self):
+        if self.year:
+            return (self.day, self.month, self.year)
+        return (self.day, self.month)
+
     def __call__(self, data=None, form=None):
         data = data or {}
         now = datetime.date.today()
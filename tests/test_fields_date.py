@@ -88,3 +88,44 @@ def test_form_tz():
     dt = datetime(1979, 5, 30, 4, 0, 0)
     form = MyForm({}, {'mydate': dt}, tz='America/Lima')
     assert form.mydate.as_input() == u'<input name="mydate" type="date" value="1979-05-29">'
+
+
+def test_form_tz_is_resolved_once():
+    class MyForm(f.Form):
+        mydate = f.Date()
+        otherdate = f.Date(tz='Europe/Madrid')
+
+    form = MyForm({}, tz='America/Lima')
+    assert form._tz is pytz.timezone('America/Lima')
+    assert form.mydate.tz is form._tz
+    assert MyForm.otherdate.tz is pytz.timezone('Europe/Madrid')
+    assert form.otherdate.tz is MyForm.otherdate.tz
+
+
+def test_parse_date():
+    from solution.fields.parsing import parse_date
+
+    assert parse_date(u'1979-05-13') == datetime(1979, 5, 13)
+    assert parse_date(u'1979-5-3') == datetime(1979, 5, 3)
+    assert parse_date(u'1979-05-13-10') == datetime(1979, 5, 13, 10)
+    for value in (u'1979-02-30', u'19790513', u'invalid', u''):
+        try:
+            parse_date(value)
+        except (ValueError, TypeError):
+            pass
+        else:
+            assert False, value
+
+
+def test_validate_date_to_utc():
+    class MyForm(f.Form):
+        mydate = f.Date()
+
+    for _ in range(2):
+        form = MyForm({'mydate': u'1979-05-13'}, tz='America/Lima')
+        assert form.is_valid()
+        assert form.cleaned_data['mydate'] == datetime(1979, 5, 13, 5, 0, 0)
+
+    form = MyForm({'mydate': u'1979-05-13'}, tz='Europe/Madrid')
+    assert form.is_valid()
+    assert form.cleaned_data['mydate'] == datetime(1979, 5, 12, 22, 0, 0)
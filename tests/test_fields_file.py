@@ -0,0 +1,126 @@
+# coding=utf-8
+import hashlib
+import io
+import os
+
+import pytest
+from werkzeug.datastructures import FileStorage
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from solution.fields.file.helpers import FileSystemUploader
+
+
+def _upload(content, filename=u'file.txt'):
+    return FileStorage(io.BytesIO(content), filename=filename)
+
+
+def test_save(tmpdir):
+    uploader = FileSystemUploader(str(tmpdir), allowed=True)
+    content = b'x' * 200000
+    path = uploader.save(_upload(content), upload_to='docs')
+    assert path == os.path.join('docs', 'file.txt')
+    with open(str(tmpdir.join(path)), 'rb') as f:
+        assert f.read() == content
+    assert os.listdir(str(tmpdir.join('docs'))) == ['file.txt']
+
+    path = uploader.save(_upload(b'y'), upload_to='docs')
+    assert path == os.path.join('docs', 'file_1.txt')
+
+
+def test_save_with_digest(tmpdir):
+    uploader = FileSystemUploader(str(tmpdir), allowed=True)
+    content = b'abc' * 100000
+    path, digest = uploader.save(_upload(content), digest='sha256')
+    assert path == 'file.txt'
+    assert digest == hashlib.sha256(content).hexdigest()
+
+
+def test_save_too_large(tmpdir):
+    class Stream(io.BytesIO):
+        read_size = 0
+
+        def read(self, size=-1):
+            data = io.BytesIO.read(self, size)
+            Stream.read_size += len(data)
+            return data
+
+    uploader = FileSystemUploader(str(tmpdir), allowed=True, max_size=1000)
+    filesto = FileStorage(Stream(b'x' * 1000000), filename=u'file.txt',
+                          content_length=1)
+    with pytest.raises(RequestEntityTooLarge):
+        uploader.save(filesto)
+    # Stopped reading and left nothing behind
+    assert Stream.read_size < 1000000
+    assert os.listdir(str(tmpdir)) == []
+
+
+def test_find_free_index(tmpdir):
+    from solution.fields.file.helpers import find_free_index
+
+    assert find_free_index(str(tmpdir), u'image', u'.jpg') == 0
+    for num in (1, 2, 3, 7, 8, 100):
+        tmpdir.join(u'image.jpg').write(b'')
+        for i in range(1, num):
+            tmpdir.join(u'image_%i.jpg' % i).write(b'')
+        assert find_free_index(str(tmpdir), u'image', u'.jpg') == num
+
+
+def test_reserve_unique_filename(tmpdir):
+    from solution.fields.file import helpers
+
+    for i in range(50):
+        tmpdir.join(u'cold_%i.jpg' % i if i else u'cold.jpg').write(b'')
+    names = [helpers.reserve_unique_filename(str(tmpdir), '', u'cold', u'.jpg')
+             for _ in range(3)]
+    assert names == [u'cold_50.jpg', u'cold_51.jpg', u'cold_52.jpg']
+
+    # Taken by someone else after being cached
+    for i in range(53, 60):
+        tmpdir.join(u'cold_%i.jpg' % i).write(b'')
+    assert helpers.reserve_unique_filename(
+        str(tmpdir), '', u'cold', u'.jpg') == u'cold_60.jpg'
+
+
+def test_reserve_unique_filename_concurrently(tmpdir):
+    import threading
+    from solution.fields.file.helpers import reserve_unique_filename
+
+    names = []
+
+    def reserve():
+        for _ in range(20):
+            names.append(
+                reserve_unique_filename(str(tmpdir), '', u'same', u'.txt'))
+
+    threads = [threading.Thread(target=reserve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(names) == len(set(names)) == 160
+    assert len(tmpdir.listdir()) == 160
+
+
+def test_move_to_unique_filename(tmpdir, monkeypatch):
+    import errno
+    from solution.fields.file.helpers import move_to_unique_filename
+
+    def move(content):
+        temp = tmpdir.join(u'.temp')
+        temp.write(content)
+        return move_to_unique_filename(
+            str(temp), str(tmpdir), 'docs', u'doc', u'.txt')
+
+    tmpdir.mkdir('docs')
+    assert move(b'one') == u'doc.txt'
+    assert move(b'two') == u'doc_1.txt'
+
+    def link(source, dest):
+        raise OSError(errno.EPERM, 'Not supported')
+    monkeypatch.setattr(os, 'link', link)
+    assert move(b'three') == u'doc_2.txt'
+
+    assert sorted(os.listdir(str(tmpdir))) == ['docs']
+    assert tmpdir.join('docs', u'doc.txt').read() == 'one'
+    assert tmpdir.join('docs', u'doc_1.txt').read() == 'two'
+    assert tmpdir.join('docs', u'doc_2.txt').read() == 'three'
@@ -64,10 +64,22 @@ def test_validate_date():
     field.load_data([u'1979-05-13'])
     assert field.validate() == date(1979, 5, 13)
 
+    field = f.SimpleDate()
+    field.load_data(u'1979-5-3')
+    assert field.validate() == date(1979, 5, 3)
+
     field = f.SimpleDate()
     field.load_data(u'invalid')
     assert field.validate() is None
 
+    field = f.SimpleDate()
+    field.load_data(u'1979-02-30')
+    assert field.validate() is None
+
+    field = f.SimpleDate()
+    field.load_data(u'1979-05-13-10')
+    assert field.validate() is None
+
 
 def test_validate_date_with_default():
     today = date.today()
@@ -94,3 +94,20 @@ def test_validate_time_with_default():
     dt = datetime.time(4, 48, 16)
     field = f.Time(default=dt)
     assert field.validate() == dt
+
+
+def test_parse_time():
+    from solution.fields import parsing
+
+    assert parsing.parse_time(u'16:23') == datetime.time(16, 23)
+    assert parsing.parse_time(u'04:23') == datetime.time(4, 23)
+    assert parsing.parse_time(u'4:23 pm') == datetime.time(16, 23)
+    assert parsing.parse_time(u'4:23:10') == datetime.time(4, 23, 10)
+    assert parsing.parse_time(u'25:00') is None
+    assert parsing.parse_time(u'1a:00') is None
+    assert parsing.parse_time(u'invalid') is None
+    assert parsing.parse_time(u'16:23') is parsing.parse_time(u'16:23')
+
+    for i in range(parsing.TIMES_CACHE_SIZE + 10):
+        parsing.parse_time(u'%i:%i' % (i // 60, i % 60))
+    assert len(parsing._times) <= parsing.TIMES_CACHE_SIZE
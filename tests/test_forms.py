@@ -691,3 +691,812 @@ def test_form_with_formset_as_dict():
     expected = sorted(list(expdict.items()))
     assert result == expected
     assert form.as_json()
+
+
+def test_as_json_streams_the_same_json():
+    import datetime
+    import io
+    import json
+
+    class RowForm(f.Form):
+        a = f.Text()
+        when = f.Date()
+        kind = f.Select(items=[(u'1', u'Ñandú'), (u'2', u'"Two"')])
+
+    class SubForm(f.Form):
+        c = f.Collection()
+
+    class WrapForm(f.Form):
+        title = f.Text(validate=[f.Required])
+        sub = SubForm
+        rows = f.FormSet(RowForm)
+        others = f.FormSet(RowForm)
+
+    data = {'rows.1-a': u'foo', 'rows.2-kind': u'2', 'sub.c': u'x, y'}
+    obj = {'rows': [{'when': datetime.datetime(2019, 6, 30)}]}
+    form = WrapForm(data, obj=obj)
+    form.is_valid()
+
+    expected = json.dumps(form.as_dict(), default=f.utils.json_serial)
+    assert form.as_json(serializer='json') == expected
+    assert form.rows.as_json(serializer='json') == json.dumps(
+        form.rows.as_dict(), default=f.utils.json_serial)
+
+    fp = io.StringIO()
+    form.dump_json(fp, serializer='json')
+    assert fp.getvalue() == expected
+
+    fp = io.BytesIO()
+    form.dump_json(fp, bytes=True)
+    assert json.loads(fp.getvalue().decode('utf-8')) == json.loads(expected)
+    assert json.loads(form.as_json()) == json.loads(expected)
+
+    compact = json.dumps(
+        form.as_dict(), default=f.utils.json_serial, separators=(',', ':'))
+    try:
+        orjson_json = form.as_json(serializer='orjson')
+    except ImportError:
+        pass
+    else:
+        assert orjson_json == compact.replace(u'\\u00d1and\\u00fa', u'Ñandú')
+
+
+def test_as_json_uses_overridden_as_dict():
+    import json
+
+    class RowForm(f.Form):
+        a = f.Text()
+
+        def as_dict(self):
+            dd = super(RowForm, self).as_dict()
+            dd['row'] = True
+            return dd
+
+    class MyForm(f.Form):
+        b = f.Text()
+        rows = f.FormSet(RowForm)
+
+        def as_dict(self):
+            dd = super(MyForm, self).as_dict()
+            dd['csrf'] = u'token'
+            return dd
+
+    class WrapForm(f.Form):
+        sub = MyForm
+
+    form = MyForm({'rows.1-a': u'x'})
+    assert json.loads(form.as_json())['csrf'] == u'token'
+    assert json.loads(form.as_json())['rows'][0]['row'] is True
+    assert json.loads(form.rows.as_json())[0]['row'] is True
+    assert json.loads(WrapForm().as_json())['sub']['csrf'] == u'token'
+
+
+def test_json_serializers():
+    import datetime
+    import json
+    from solution import serializers
+
+    value = {
+        'a': [u'Ñandú', 1, 2.5, None, True],
+        'b': {'c': datetime.datetime(2019, 6, 30, 10, 30)},
+        'd': datetime.date(2019, 6, 30),
+        'e': datetime.time(22, 30),
+    }
+    expected = {
+        'a': [u'Ñandú', 1, 2.5, None, True],
+        'b': {'c': u'2019-06-30T10:30:00'},
+        'd': u'2019-06-30',
+        'e': u'22:30:00',
+    }
+    for name in ('orjson', 'ujson', 'simplejson', 'json'):
+        try:
+            serializer = serializers.get_serializer(name)
+        except ImportError:
+            continue
+        assert json.loads(serializer.dumps(value)) == expected
+        assert json.loads(serializer.dumpb(value).decode('utf-8')) == expected
+
+    try:
+        serializers.set_default('json')
+        assert serializers.get_serializer().name == 'json'
+    finally:
+        serializers.set_default(None)
+    try:
+        serializers.get_serializer('nope')
+    except ValueError:
+        pass
+    else:
+        assert False
+
+
+def test_schema_is_compiled_once():
+    class MyForm(f.Form):
+        a = f.Text()
+        b = f.Text()
+
+    form1 = MyForm()
+    schema = MyForm._get_schema()
+    form2 = MyForm()
+    assert MyForm._get_schema() is schema
+    assert [name for name, _, _, _ in schema.fields] == ['a', 'b']
+    assert form1.a is not form2.a
+
+
+def test_schema_inherited_fields_and_hooks():
+    class BaseForm(f.Form):
+        a = f.Text()
+
+        def clean_a(self, py_value, **kwargs):
+            return py_value.upper()
+
+    class MyForm(BaseForm):
+        b = f.Text()
+
+        def prepare_b(self, obj_value, **kwargs):
+            return u'prepared'
+
+    form = MyForm({'a': u'abc'})
+    assert sorted(form._fields) == ['a', 'b']
+    assert form.b.value == u'prepared'
+    assert form.is_valid()
+    assert form.cleaned_data['a'] == u'ABC'
+
+
+def test_schema_ignores_properties():
+    class MyForm(f.Form):
+        a = f.Text()
+
+        @property
+        def boom(self):
+            raise AssertionError('properties must not be evaluated')
+
+    form = MyForm({'a': u'abc'})
+    assert list(form._fields) == ['a']
+
+
+def test_schema_follows_class_changes():
+    class BaseForm(f.Form):
+        a = f.Text()
+
+    class MyForm(BaseForm):
+        b = f.Text()
+
+    assert sorted(MyForm()._fields) == ['a', 'b']
+    BaseForm.c = f.Text()
+    assert sorted(MyForm()._fields) == ['a', 'b', 'c']
+    del BaseForm.c
+    assert sorted(MyForm()._fields) == ['a', 'b']
+
+
+def test_schema_includes_instance_fields():
+    class MyForm(f.Form):
+        a = f.Text()
+
+        def __init__(self, *args, **kwargs):
+            self.extra_field = f.Text(validate=[f.Required])
+            super(MyForm, self).__init__(*args, **kwargs)
+
+        def clean_extra_field(self, py_value, **kwargs):
+            return py_value and py_value.upper()
+
+    form = MyForm({'a': u'abc'})
+    assert sorted(form._fields) == ['a', 'extra_field']
+    assert form.extra_field.name == 'extra_field'
+    assert type(form.extra_field) is f.Text
+    assert not form.is_valid()
+    assert 'extra_field' in form._errors
+
+    form = MyForm({'a': u'abc', 'extra_field': u'xyz'})
+    assert form.is_valid()
+    assert form.cleaned_data['extra_field'] == u'XYZ'
+    # The class schema is not changed
+    assert len(MyForm._get_schema().fields) == 1
+
+
+def test_schema_instance_fields_replace_the_class_ones():
+    class MyForm(f.Form):
+        a = f.Text(validate=[f.AreEqual('a', 'b')])
+        b = f.Text()
+
+        def __init__(self, *args, **kwargs):
+            self.a = f.Text(validate=[f.Required])
+            self.sub = SubForm
+            super(MyForm, self).__init__(*args, **kwargs)
+
+    class SubForm(f.Form):
+        c = f.Text()
+
+    form = MyForm({'a': u'x', 'b': u'y', 'sub.c': u'z'})
+    assert form._form_schema.form_validated == []
+    assert form.is_valid()
+    assert form.sub.c.value == u'z'
+    assert MyForm.a.form_validators
+    assert MyForm._get_schema().form_validated == ['a']
+
+
+def test_bound_fields_share_the_definition():
+    class MyForm(f.Form):
+        a = f.Text(validate=[f.Required], classes=u'big')
+
+    definition = MyForm.a
+    form1 = MyForm({'a': u'one'})
+    form2 = MyForm({'a': u'two'})
+
+    assert isinstance(form1.a, f.Text)
+    assert form1.a is not definition
+    assert form1.a.validators is definition.validators
+    assert form1.a.extra is definition.extra
+    assert not hasattr(form1.a, '__dict__') or not form1.a.__dict__
+
+    assert form1.a.form is form1
+    assert form1.a.value == u'one'
+    assert form2.a.value == u'two'
+    assert definition.str_value is None
+
+
+def test_bound_fields_state_is_independent():
+    class MyForm(f.Form):
+        a = f.Text(validate=[f.Required])
+
+    form1 = MyForm({'a': u''})
+    form2 = MyForm({'a': u'two', 'a__deleted': 1})
+    assert not form1.is_valid()
+    assert form1.a.error
+    assert not hasattr(form1.a, '_deleted')
+    assert form2.a.error is None
+    assert form2.a._deleted
+
+
+def test_bound_fields_keep_function_attributes():
+    def get_default():
+        return u'default'
+
+    class MyForm(f.Form):
+        a = f.Text(default=get_default)
+
+    form = MyForm()
+    assert form.a.default == u'default'
+
+
+def test_fields_have_no_dict():
+    class MyForm(f.Form):
+        a = f.Text()
+        b = f.Select(items=[(u'1', u'One')])
+        c = f.Boolean()
+        d = f.Collection()
+
+    form = MyForm()
+    for name in 'abcd':
+        assert not hasattr(getattr(MyForm, name), '__dict__')
+        assert not hasattr(getattr(form, name), '__dict__')
+
+
+def test_copied_fields_dont_share_the_definition():
+    from copy import copy
+
+    class MyForm(f.Form):
+        a = f.Text(validate=[f.Required])
+        b = f.Select(items=[(u'1', u'One')])
+
+    form = MyForm()
+    a = MyForm.a
+    copied = copy(a)
+    copied.hide_value = True
+    assert not a.hide_value
+    assert copied.validators == a.validators
+    assert copied._attrs is not a._attrs
+
+    b = copy(MyForm.b)
+    b.items = [(u'2', u'Two')]
+    assert MyForm.b.items == [(u'1', u'One')]
+    assert b.is_accepted(u'2') and not MyForm.b.is_accepted(u'2')
+
+    bound = copy(form.a)
+    assert bound.__class__ is form.a.__class__
+    assert bound.name == u'a'
+
+
+def test_bound_fields_attributes_can_be_changed():
+    class MyForm(f.Form):
+        a = f.Text(validate=[f.Required])
+
+    form1 = MyForm({'a': u''})
+    form2 = MyForm({'a': u''})
+    form1.a.hide_value = True
+    form1.a.optional = True
+    form1.a.validators = []
+    form1.a.field_validators = []
+    assert form1.is_valid()
+    assert not form2.is_valid()
+    assert not form2.a.hide_value
+    assert not MyForm.a.hide_value
+    assert MyForm.a.validators
+
+    # Changing the definition doesn't change the bound fields
+    MyForm.a.hide_value = True
+    assert not form2.a.hide_value
+
+
+def test_field_subclasses_with_slots_can_set_attributes():
+    class Counted(f.Text):
+        __slots__ = ('calls', )
+
+        def __init__(self, **kwargs):
+            self.calls = 0
+            super(Counted, self).__init__(**kwargs)
+
+        def str_to_py(self, **kwargs):
+            self.calls += 1
+            return super(Counted, self).str_to_py(**kwargs)
+
+    class MyForm(f.Form):
+        a = Counted()
+
+    form = MyForm({'a': u'hi'})
+    assert form.is_valid()
+    assert form.is_valid()
+    assert form.a.calls == 2
+    assert MyForm().a.calls == 0
+    assert MyForm.a.calls == 0
+
+
+def test_field_subclasses_can_add_attributes():
+    class Upper(f.Text):
+        shout = False
+
+        def __init__(self, shout=False, **kwargs):
+            self.shout = shout
+            self.suffix = u'!'
+            super(Upper, self).__init__(**kwargs)
+
+        def str_to_py(self, **kwargs):
+            value = self.str_value.upper()
+            return value + self.suffix if self.shout else value
+
+    class MyForm(f.Form):
+        a = Upper(shout=True, validate=[f.Required])
+
+    form = MyForm({'a': u'hi'})
+    assert form.is_valid()
+    assert form.cleaned_data['a'] == u'HI!'
+    assert form.a.shout
+    assert form.a.validators is MyForm.a.validators
+
+
+def test_bound_select_items_can_be_replaced():
+    class MyForm(f.Form):
+        a = f.Select(items=[(u'1', u'One')], validate=[f.Required])
+
+    form1 = MyForm({'a': u'2'})
+    form2 = MyForm({'a': u'2'})
+    form1.a.items = [(u'1', u'One'), (u'2', u'Two')]
+    assert form1.is_valid()
+    assert not form2.is_valid()
+    assert MyForm.a.items == [(u'1', u'One')]
+
+
+def test_validators_are_partitioned():
+    field = f.Text(validate=[f.Required, f.AreEqual('a', 'b')])
+    assert len(field.validators) == 2
+    assert [type(val) for val in field.field_validators] == [f.Required]
+    assert [type(val) for val in field.form_validators] == [f.AreEqual]
+
+
+def test_form_validation_only_visits_form_validated_fields():
+    calls = []
+
+    class Counted(f.AtLeastOne):
+        def __call__(self, data=None, form=None):
+            calls.append(1)
+            return super(Counted, self).__call__(data, form)
+
+    attrs = {'f%i' % i: f.Text() for i in range(200)}
+    attrs['f0'] = f.Text(validate=[Counted(['f0', 'f1'])])
+    attrs['f1'] = f.Text(validate=[f.AreEqual('f1', 'f2')])
+    MyForm = type('MyForm', (f.Form,), attrs)
+    assert MyForm._get_schema().form_validated == ['f0', 'f1']
+
+    form = MyForm({'f0': u'a', 'f1': u'b', 'f2': u'b'})
+    assert form.is_valid()
+    assert len(calls) == 1
+
+    form = MyForm({'f0': u'a', 'f1': u'b', 'f2': u'c'})
+    assert not form.is_valid()
+    assert list(form._errors) == ['f1']
+
+
+def test_form_validation_of_fields_overriding_validate():
+    class SameAsA(f.Text):
+        def validate(self, form=None, cleaned_data=None, **kwargs):
+            if cleaned_data is None:
+                return super(SameAsA, self).validate(form, **kwargs)
+            if cleaned_data.get('a') != cleaned_data.get('b'):
+                self.error = f.ValidationError(u'Different')
+
+    class MyForm(f.Form):
+        a = f.Text()
+        b = SameAsA()
+
+    assert MyForm._get_schema().form_validated == ['b']
+    assert not MyForm({'a': u'x', 'b': u'y'}).is_valid()
+    assert MyForm({'a': u'x', 'b': u'x'}).is_valid()
+
+
+class CountedValidator(f.Validator):
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, py_value=None, form=None):
+        self.calls += 1
+        return py_value != u'invalid'
+
+
+def test_load_data_marks_changed_fields_dirty():
+    class MyForm(f.Form):
+        a = f.Text()
+        b = f.Text()
+
+    form = MyForm({'a': u'1', 'b': u'2'})
+    assert form.a.dirty and form.b.dirty
+    form.is_valid()
+    assert not form.a.dirty and not form.b.dirty
+
+    form.load_data({'a': u'1', 'b': u'3'})
+    assert not form.a.dirty
+    assert form.b.dirty
+    assert form.b.value == u'3'
+
+
+def test_incremental_validation():
+    va = CountedValidator()
+    vb = CountedValidator()
+
+    class MyForm(f.Form):
+        a = f.Text(validate=[va])
+        b = f.Text(validate=[vb])
+        c = f.Text(validate=[f.AreEqual('b', 'c')])
+
+    form = MyForm({'a': u'invalid', 'b': u'x', 'c': u'x'})
+    assert not form.is_valid(incremental=True)
+    assert (va.calls, vb.calls) == (1, 1)
+    assert list(form._errors) == ['a']
+
+    form.load_data({'a': u'invalid', 'b': u'y', 'c': u'x'})
+    assert not form.is_valid(incremental=True)
+    assert (va.calls, vb.calls) == (1, 2)
+    assert sorted(form._errors) == ['a', 'c']
+    assert form.a.error
+
+    form.load_data({'a': u'ok', 'b': u'y', 'c': u'y'})
+    assert form.is_valid(incremental=True)
+    assert (va.calls, vb.calls) == (2, 2)
+    assert form.cleaned_data == {'a': u'ok', 'b': u'y', 'c': u'y'}
+
+    # A full validation runs everything again
+    assert form.is_valid()
+    assert (va.calls, vb.calls) == (3, 3)
+
+
+def test_incremental_validation_of_subforms():
+    va = CountedValidator()
+
+    class SubForm(f.Form):
+        a = f.Text(validate=[va])
+
+    class MyForm(f.Form):
+        sub = SubForm
+        b = f.Text()
+
+    form = MyForm({'sub.a': u'1', 'b': u'1'})
+    sub = form.sub
+    assert form.is_valid(incremental=True)
+    assert va.calls == 1
+
+    form.load_data({'sub.a': u'1', 'b': u'2'})
+    assert form.sub is sub
+    assert form.is_valid(incremental=True)
+    assert va.calls == 1
+    assert form.cleaned_data['b'] == u'2'
+
+    form.load_data({'sub.a': u'invalid', 'b': u'2'})
+    assert not form.is_valid(incremental=True)
+    assert va.calls == 2
+
+
+class CountedAreEqual(f.AreEqual):
+    calls = 0
+
+    def __call__(self, data=None, form=None):
+        self.calls += 1
+        return super(CountedAreEqual, self).__call__(data, form)
+
+
+def test_form_validators_dependency_graph():
+    class MyForm(f.Form):
+        a = f.Text()
+        b = f.Text(validate=[f.AreEqual('a', 'b')])
+        c = f.Text(validate=[f.FormValidator()])
+        d = f.Text(validate=[f.AtLeastOne(['a', 'd'])])
+
+    schema = MyForm._get_schema()
+    assert schema.form_validated == ['b', 'c', 'd']
+    assert schema.dependents == {'a': ['b', 'd'], 'b': ['b'], 'd': ['d']}
+    assert schema.always_validated == {'c'}
+    assert schema.get_affected(['b']) == ['b', 'c']
+    assert schema.get_affected(['a']) == ['b', 'c', 'd']
+
+
+def test_form_validators_skipped_if_inputs_are_invalid():
+    validator = CountedAreEqual('a', 'b')
+
+    class MyForm(f.Form):
+        a = f.Text(validate=[f.ValidEmail])
+        b = f.Text(validate=[validator])
+
+    form = MyForm({'a': u'nope', 'b': u'other'})
+    assert not form.is_valid()
+    assert validator.calls == 0
+    assert list(form._errors) == ['a']
+
+    form = MyForm({'a': u'a@example.com', 'b': u'other'})
+    assert not form.is_valid()
+    assert validator.calls == 1
+    assert list(form._errors) == ['b']
+
+
+def test_incremental_validation_runs_affected_form_validators():
+    validator = CountedAreEqual('a', 'b')
+
+    class MyForm(f.Form):
+        a = f.Text()
+        b = f.Text(validate=[validator])
+        c = f.Text()
+
+    form = MyForm({'a': u'1', 'b': u'2', 'c': u'3'})
+    assert not form.is_valid(incremental=True)
+    assert validator.calls == 1
+
+    form.load_data({'a': u'1', 'b': u'2', 'c': u'4'})
+    assert not form.is_valid(incremental=True)
+    assert validator.calls == 1
+    assert list(form._errors) == ['b']
+    assert form.b.error.message == validator.message
+
+    form.load_data({'a': u'2', 'b': u'2', 'c': u'4'})
+    assert form.is_valid(incremental=True)
+    assert validator.calls == 2
+
+
+def test_validate_fields():
+    va = CountedValidator()
+    vb = CountedValidator()
+    are_equal = CountedAreEqual('b', 'c')
+
+    class MyForm(f.Form):
+        a = f.Text(validate=[va])
+        b = f.Text(validate=[vb])
+        c = f.Text(validate=[are_equal])
+        d = f.Text(validate=[f.Required])
+
+    form = MyForm({'a': u'invalid', 'b': u'x', 'c': u'y'})
+    errors = form.validate_fields(['a'])
+    assert list(errors) == ['a']
+    assert (va.calls, vb.calls, are_equal.calls) == (1, 0, 0)
+    assert form.d.error is None
+    assert form._errors == {}
+
+    errors = form.validate_fields(['b'])
+    assert list(errors) == ['c']
+    assert errors['c'].message == are_equal.message
+    assert (va.calls, vb.calls, are_equal.calls) == (1, 1, 1)
+
+    form.load_data({'a': u'invalid', 'b': u'invalid', 'c': u'y'})
+    errors = form.validate_fields(['b'])
+    assert list(errors) == ['b']
+    assert are_equal.calls == 1
+
+
+def test_validate_fields_dotted_paths():
+    class AddressForm(f.Form):
+        city = f.Text(validate=[f.Required])
+
+    class PhoneForm(f.Form):
+        number = f.Text(validate=[f.Required, f.IsNumber])
+
+    class MyForm(f.Form):
+        name = f.Text(validate=[f.Required])
+        address = AddressForm
+        phones = f.FormSet(PhoneForm)
+
+    form = MyForm({
+        'address.city': u'',
+        'phones.1-number': u'123',
+        'phones.2-number': u'abc',
+    })
+    errors = form.validate_fields(
+        ['address.city', 'phones.1.number', 'phones.2.number'])
+    assert sorted(errors) == ['address.city', 'phones.2.number']
+    assert form.name.error is None
+
+    unknown = ['nope', 'nope.x', 'name.x', 'address.nope', 'phones.x.number',
+               'phones.0.number', 'phones.9.number', 'phones.1.nope',
+               'phones.1']
+    assert form.validate_fields(unknown) == {}
+    errors = form.validate_fields(unknown + ['phones.2.number'])
+    assert list(errors) == ['phones.2.number']
+
+
+def test_lazy_subforms_and_formsets():
+    built = []
+
+    class AddressForm(f.Form):
+        city = f.Text()
+
+        def __init__(self, *args, **kwargs):
+            built.append(self)
+            super(AddressForm, self).__init__(*args, **kwargs)
+
+    class MyForm(f.Form):
+        _lazy = True
+        name = f.Text()
+        address = AddressForm
+        others = f.FormSet(AddressForm)
+
+    data = {'name': u'a', 'address.city': u'Lima', 'others.1-city': u'Cusco'}
+    form = MyForm(data)
+    assert built == []
+    assert MyForm.address is AddressForm
+
+    assert form.address.city.value == u'Lima'
+    assert len(built) == 1
+    assert form.address is built[0]
+
+    assert form.is_valid()
+    assert len(built) == 2
+    assert form.others.get_form(1).city.value == u'Cusco'
+
+
+def test_lazy_has_input_data():
+    class AddressForm(f.Form):
+        city = f.Text()
+
+    class MyForm(f.Form):
+        _lazy = True
+        address = AddressForm
+        others = f.FormSet(AddressForm)
+
+    assert not MyForm({'foo': u'bar'}).has_input_data
+    assert MyForm({'address.city': u'Lima'}).has_input_data
+    form = MyForm({'others.1-city': u'Lima'})
+    assert form.has_input_data
+    assert 'others' not in form.__dict__
+
+    # Once built, the real value is used
+    form = MyForm({'address.unrelated': u'x'})
+    assert form.has_input_data
+    form.address
+    assert not form.has_input_data
+    form = MyForm({'address.unrelated': u'x', 'others.1-city': u'Lima'})
+    form.address
+    assert form.has_input_data
+    form.others
+    assert form.has_input_data
+
+
+def test_lazy_as_dict_is_the_same():
+    class AddressForm(f.Form):
+        city = f.Text()
+
+    class EagerForm(f.Form):
+        name = f.Text()
+        address = AddressForm
+        others = f.FormSet(AddressForm)
+
+    class LazyForm(EagerForm):
+        _lazy = True
+
+    data = {'name': u'a', 'address.city': u'Lima', 'others.1-city': u'Cusco'}
+    assert LazyForm(data).as_dict() == EagerForm(data).as_dict()
+    assert EagerForm(data).address.city.value == u'Lima'
+    # The base class is not changed
+    assert EagerForm.__dict__['address'] is AddressForm
+    assert isinstance(LazyForm.__dict__['address'], f.form.LazyChild)
+
+    EagerForm.address = OtherForm = type('OtherForm', (AddressForm,), {})
+    try:
+        assert isinstance(LazyForm(data).address, OtherForm)
+        assert LazyForm.address is OtherForm
+    finally:
+        EagerForm.address = AddressForm
+
+
+def test_acquire_and_release():
+    class RowForm(f.Form):
+        b = f.Text()
+
+    class MyForm(f.Form):
+        a = f.Text(validate=[f.Required])
+        rows = f.FormSet(RowForm)
+
+    form = MyForm.acquire({'a': u'', 'a__deleted': 1, 'rows.1-b': u'x'})
+    form.a.id
+    assert not form.is_valid()
+    assert form.a.error
+    assert form.a._deleted
+    assert len(form.rows) == 1
+    form.release()
+    form.release()
+
+    form2 = MyForm.acquire({'a': u'hello'})
+    assert form2 is form
+    assert form2.a.value == u'hello'
+    assert form2.a.error is None
+    assert not hasattr(form2.a, '_deleted')
+    assert not form2.a.has_changed
+    assert len(form2.rows) == 0
+    assert form2.is_valid()
+    assert form2.cleaned_data == {'a': u'hello'}
+
+    # A second instance while the first is in use
+    form3 = MyForm.acquire({'a': u'bye'})
+    assert form3 is not form2
+    assert form2.a.value == u'hello'
+
+    # Other arguments, other pool
+    form2.release()
+    form4 = MyForm.acquire({'a': u'hello'}, prefix='x')
+    assert form4 is not form2
+    assert form4.a.name == 'x-a'
+
+
+def test_release_reset_ids_and_pool_size():
+    class MyForm(f.Form):
+        _pool_size = 1
+        a = f.Text()
+
+    forms = [MyForm.acquire() for _ in range(3)]
+    for form in forms:
+        form.a._id = u'custom'
+        form.release()
+    assert MyForm.acquire() is forms[0]
+    assert forms[0].a.id != u'custom'
+    assert MyForm.acquire() not in forms
+
+
+def test_release_forgets_objects_and_observer():
+    class RowForm(f.Form):
+        b = f.Text()
+
+    class MyForm(f.Form):
+        a = f.Text()
+        sub = RowForm
+        rows = f.FormSet(RowForm)
+
+    obj = {'a': u'x', 'sub': {'b': u'y'}, 'rows': [{'b': u'z'}]}
+    with f.observe():
+        form = MyForm.acquire(obj=obj)
+    assert form._observer is not None
+    form.release()
+    assert not form._obj
+    assert not form.sub._obj
+    assert form._observer is None
+    assert form.sub._observer is None
+    assert form.rows._observer is None
+
+    # The observer isn't part of the key of the pool
+    with f.observe() as stats:
+        form2 = MyForm.acquire({'a': u'hello'})
+    assert form2 is form
+    assert form2._observer is stats
+    assert form2.sub._observer is stats
+
+
+def test_pools_are_bounded():
+    from solution.form import MAX_POOLS, _pools
+
+    class MyForm(f.Form):
+        a = f.Text()
+
+    for i in range(MAX_POOLS + 10):
+        MyForm.acquire(prefix='p%i' % i).release()
+    assert len(_pools.pools) == MAX_POOLS
@@ -360,3 +360,158 @@ def test_formset_names():
     print('# form.subs._forms[0].a.name ==', form.subs._forms[0].a.name)
     assert form.subs.form.a.name == 'subs.1-a'
     assert form.subs._forms[0].a.name == 'subs.1-a'
+
+
+def test_formset_new_forms_from_files():
+    class MyForm(f.Form):
+        a = f.Text()
+        b = f.File()
+
+    data = {
+        'myform.1-a': 'a first',
+        'myform.3-a': 'a third',
+    }
+    files = {
+        'myform.2-b': 'b second',
+    }
+    fset = f.FormSet(MyForm, data=data, files=files)
+    assert len(fset._forms) == 3
+    assert fset._forms[1].b.file_data == 'b second'
+
+
+def test_nested_formsets_share_the_index():
+    class ItemForm(f.Form):
+        name = f.Text()
+
+    class RowForm(f.Form):
+        title = f.Text()
+        items = f.FormSet(ItemForm)
+
+    class WrapForm(f.Form):
+        rows = f.FormSet(RowForm)
+
+    data = {
+        'rows.1-title': u'first',
+        'rows.1-items.1-name': u'one',
+        'rows.1-items.2-name': u'two',
+        'rows.2-title': u'second',
+    }
+    form = WrapForm(data)
+    rows = form.rows._forms
+    assert len(rows) == 2
+    assert len(rows[0].items._forms) == 2
+    assert len(rows[1].items._forms) == 0
+    assert rows[0].items._index is form._index
+    assert rows[0].items._forms[1].name.value == u'two'
+
+
+def test_formset_load_data_reuses_rows():
+    calls = []
+
+    def count(py_value=None, form=None):
+        calls.append(py_value)
+        return True
+
+    class RowForm(f.Form):
+        name = f.Text(validate=[count])
+
+    data = {'row.1-name': u'a', 'row.2-name': u'b'}
+    formset = f.FormSet(RowForm, name='row', data=data)
+    rows = list(formset)
+    assert formset.is_valid(incremental=True)
+    assert sorted(calls) == [u'a', u'b']
+
+    formset.load_data({'row.1-name': u'a', 'row.2-name': u'c',
+                       'row.3-name': u'd'})
+    assert list(formset)[:2] == rows
+    assert len(formset) == 3
+    assert formset.is_valid(incremental=True)
+    assert sorted(calls) == [u'a', u'b', u'c', u'd']
+
+
+def test_formset_template_is_shared():
+    class MyForm(f.Form):
+        a = f.Text()
+
+    fs1 = f.FormSet(MyForm, name='rows', data={'rows.1-a': u'foo'})
+    fs2 = f.FormSet(MyForm, name='rows')
+    template = fs1.get_template()
+    assert fs2.get_template() is template
+    assert template.form.a.value == u''
+    assert f.FormSet(MyForm, name='others').get_template() is not template
+
+    assert template.static
+    assert template.as_dict() == fs1.get_empty_form(1).as_dict()
+    # The memoized dict is copied
+    data = template.as_dict()
+    data['rows.1-a']['value'] = u'mutated'
+    data['extra'] = u'mutated'
+    assert template.as_dict() == fs1.get_empty_form(1).as_dict()
+
+    MyForm.b = f.Text()
+    assert fs1.get_template() is not template
+    assert 'rows.1-b' in fs1.get_template().as_dict()
+
+
+def test_formset_form_is_new():
+    class MyForm(f.Form):
+        a = f.Text()
+
+    fs1 = f.FormSet(MyForm, name='rows')
+    fs2 = f.FormSet(MyForm, name='rows')
+    form = fs1.form
+    assert form is not fs1.form
+    form.load_data({'rows.1-a': u'foo'})
+    assert form.a.value == u'foo'
+    assert fs2.form.a.value == u''
+    assert fs2.get_template().form.a.value == u''
+
+
+def test_formset_templates_are_freed_with_the_class():
+    import gc
+    import weakref
+
+    class MyForm(f.Form):
+        a = f.Text()
+
+    f.FormSet(MyForm, name='rows').get_template()
+    ref = weakref.ref(MyForm)
+    del MyForm
+    gc.collect()
+    assert ref() is None
+
+
+def test_formset_template_is_not_observed():
+    class MyForm(f.Form):
+        a = f.Text()
+
+    class WrapForm(f.Form):
+        rows = f.FormSet(MyForm)
+
+    with f.observe() as stats:
+        form = WrapForm()
+        form.as_json()
+    template = form.rows.get_template()
+    assert template.form._observer is None
+    assert 'MyForm.init_fields' not in stats.as_dict()['phases']
+    assert form._observer is stats
+
+
+def test_formset_template_with_callable_default():
+    counter = []
+
+    def get_default():
+        counter.append(1)
+        return u'%i' % len(counter)
+
+    class MyForm(f.Form):
+        a = f.Text(default=get_default)
+
+    class WrapForm(f.Form):
+        rows = f.FormSet(MyForm)
+
+    form = WrapForm()
+    template = form.rows.get_template()
+    assert not template.static
+    value = form.as_dict()['_rows_form']['rows.1-a']['value']
+    assert form.as_dict()['_rows_form']['rows.1-a']['value'] != value
@@ -0,0 +1,91 @@
+# coding=utf-8
+import solution as f
+
+
+class ContactForm(f.Form):
+    email = f.Text(validate=[f.ValidEmail])
+    email2 = f.Text(validate=[f.AreEqual('email', 'email2')])
+
+
+class ListForm(f.Form):
+    contacts = f.FormSet(ContactForm)
+
+
+def test_no_observer():
+    form = ContactForm({'email': u'a@example.com'})
+    assert form._observer is None
+    form.is_valid()
+
+
+def test_observe_form_phases():
+    data = {'email': u'a@example.com', 'email2': u'a@example.com'}
+    with f.observe() as stats:
+        form = ContactForm(data)
+        assert form.is_valid()
+        form.save()
+
+    phases = stats.as_dict()['phases']
+    for phase in ('init_fields', 'init_data', 'validate_fields',
+                  'validate_form', 'clean', 'save'):
+        timing = phases['ContactForm.' + phase]
+        assert timing['count'] == 1
+        assert timing['total'] >= 0
+
+    fields = stats.as_dict()['fields']
+    assert fields['ContactForm.email.validate_field']['count'] == 1
+    assert fields['ContactForm.email2.validate_form']['count'] == 1
+
+    validators = stats.as_dict()['validators']
+    assert validators['ValidEmail'] == {'calls': 1, 'failures': 0}
+    assert validators['AreEqual'] == {'calls': 1, 'failures': 0}
+
+
+def test_observe_counts_failures():
+    with f.observe() as stats:
+        form = ContactForm({'email': u'nope', 'email2': u'x'})
+        assert not form.is_valid()
+    validators = stats.as_dict()['validators']
+    assert validators['ValidEmail'] == {'calls': 1, 'failures': 1}
+
+
+def test_observe_ends_with_block():
+    with f.observe():
+        pass
+    assert ContactForm()._observer is None
+
+
+def test_observer_argument_and_formsets():
+    data = {
+        'contacts.1-email': u'a@example.com',
+        'contacts.1-email2': u'a@example.com',
+        'contacts.2-email': u'b@example.com',
+        'contacts.2-email2': u'b@example.com',
+    }
+    stats = f.Stats()
+    form = ListForm(data, observer=stats)
+    assert form.is_valid()
+
+    phases = stats.as_dict()['phases']
+    assert phases['FormSet.ContactForm.init']['count'] == 1
+    assert phases['FormSet.ContactForm.is_valid']['count'] == 1
+    assert phases['ContactForm.init_data']['count'] == 2
+    assert phases['ListForm.validate_fields']['count'] == 1
+    assert stats.validators['ValidEmail'][0] == 2
+
+    stats.clear()
+    assert stats.as_dict()['phases'] == {}
+
+
+def test_custom_observer():
+    calls = []
+
+    class MyObserver(f.Observer):
+        def on_phase(self, owner, phase, elapsed):
+            calls.append(phase)
+
+    data = {'email': u'a@example.com', 'email2': u'a@example.com'}
+    form = ContactForm(data, observer=MyObserver())
+    assert form.is_valid()
+    assert calls == [
+        'init_fields', 'init_data', 'validate_fields', 'validate_form',
+        'clean']
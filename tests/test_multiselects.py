@@ -261,3 +261,24 @@ def test_multiselect_as_dict():
     result = sorted(list(field.as_dict().items()))
     expected = sorted(list(expdict.items()))
     assert result == expected
+
+
+def test_validate_multiselect_with_groups():
+    items1 = [u'First group', (1, u'A'), (2, u'B')]
+    items = [items1, (3, u'C')]
+    field = f.MultiSelect(items=items)
+    field.load_data([u'1', u'3', u'9'])
+    assert field.validate() == [u'1', u'3']
+
+
+def test_iter_multiselect_matches_as_select():
+    items = [(str(i), 'Option %d' % i) for i in range(250)]
+    items.append([u'Group', ('a', 'A'), ('b', 'B')])
+    field = f.MultiSelect(items=items)
+    field.str_value = [u'b', u'3']
+
+    chunks = list(field.iter_select())
+    assert len(chunks) > 1
+    assert u''.join(chunks) == field.as_select()
+    assert u''.join(field.iter_checks()) == field.as_checks()
+    assert u''.join(field.iter_checkboxes()) == field.as_checkboxes()
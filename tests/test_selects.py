@@ -307,3 +307,279 @@ def test_select_as_dict():
     result = sorted(list(field.as_dict().items()))
     expected = sorted(list(expdict.items()))
     assert result == expected
+
+
+def test_accepted_values_are_cached():
+    items1 = [u'First group', (1, u'A'), (2, u'B')]
+    items = [items1, (3, u'C')]
+    field = f.Select(items=items)
+
+    accepted = field._items_index.get_accepted(items)
+    assert accepted == frozenset(['1', '2', '3'])
+    assert field._items_index.get_accepted(items) is accepted
+
+    field.load_data(u'2')
+    assert field.validate() == u'2'
+
+    field.items = [(4, u'D')]
+    field.load_data(u'2')
+    assert field.validate() is None
+    field.load_data(u'4')
+    assert field.validate() == u'4'
+
+
+def test_accepted_values_with_callable_items():
+    def get_items(form):
+        return [(1, u'A'), (2, u'B')]
+
+    field = f.Select(items=get_items)
+    field.load_data(u'2')
+    assert field.validate() == u'2'
+    field.load_data(u'3')
+    assert field.validate() is None
+
+
+def test_accepted_values_shared_by_bound_fields():
+    items = [(1, u'A'), (2, u'B')]
+
+    class MyForm(f.Form):
+        choice = f.Select(items=items)
+
+    form1 = MyForm({'choice': u'1'})
+    form2 = MyForm({'choice': u'5'})
+    assert form1.is_valid()
+    assert form1.cleaned_data['choice'] == u'1'
+    assert form2.is_valid()
+    assert form2.cleaned_data['choice'] is None
+    assert form1.choice._items_index is form2.choice._items_index
+
+
+def test_select_deepcopy():
+    from copy import deepcopy
+
+    field = f.Select(items=[(1, u'A'), (2, u'B')])
+    assert field.is_accepted('1')
+    copied = deepcopy(field)
+    assert copied.items == field.items
+    assert copied._items_index is not field._items_index
+    assert copied.is_accepted('2')
+
+
+def _counting_items():
+    calls = []
+
+    def get_items(form):
+        calls.append(form)
+        return [(1, u'A'), (2, u'B'), (3, u'C'), (4, u'D'), (5, u'E'),
+                (6, u'F'), (7, u'G')]
+    return get_items, calls
+
+
+def test_callable_items_not_cached():
+    get_items, calls = _counting_items()
+
+    class MyForm(f.Form):
+        choice = f.Select(items=get_items)
+
+    form = MyForm({'choice': u'2'})
+    form.is_valid()
+    form.choice()
+    form.choice.as_dict()
+    assert len(calls) == 3
+
+
+def test_callable_items_cached_per_form():
+    get_items, calls = _counting_items()
+
+    class MyForm(f.Form):
+        choice = f.Select(items=get_items, cache=True)
+
+    form = MyForm({'choice': u'2'})
+    assert form.is_valid()
+    form.choice()
+    form.choice.as_dict()
+    list(form.choice)
+    assert calls == [form]
+
+    form.choice.invalidate_items()
+    form.choice()
+    assert len(calls) == 2
+
+    form2 = MyForm({'choice': u'2'})
+    form2.choice()
+    assert calls[-1] is form2
+
+    form2.reset()
+    form2.choice()
+    assert len(calls) == 4
+
+
+def test_callable_items_shared_cache():
+    get_items, calls = _counting_items()
+    cache = f.ItemsCache()
+
+    class MyForm(f.Form):
+        choice = f.Select(items=get_items, cache=cache)
+
+    form1 = MyForm({'choice': u'2'})
+    form2 = MyForm({'choice': u'3'})
+    assert form1.is_valid() and form2.is_valid()
+    form1.choice()
+    form2.choice()
+    assert len(calls) == 1
+
+    form2.choice.invalidate_items()
+    form1.choice()
+    assert len(calls) == 2
+
+    cache.clear()
+    form1.choice()
+    assert len(calls) == 3
+
+
+def test_callable_items_shared_cache_by_key():
+    get_items, calls = _counting_items()
+    cache = f.ItemsCache(key=lambda form: form._locale, maxsize=1)
+
+    class MyForm(f.Form):
+        choice = f.Select(items=get_items, cache=cache)
+
+    MyForm(locale='en').choice()
+    MyForm(locale='en').choice()
+    assert len(calls) == 1
+    MyForm(locale='es').choice()
+    assert len(calls) == 2
+    MyForm(locale='en').choice()
+    assert len(calls) == 3
+
+
+def test_callable_items_shared_cache_by_many_fields():
+    cache = f.ItemsCache(ttl=60)
+
+    def get_countries(form):
+        return [(u'pe', u'Peru')]
+
+    def get_colors(form):
+        return [(u'red', u'Red')]
+
+    class MyForm(f.Form):
+        country = f.Select(items=get_countries, cache=cache)
+        color = f.Select(items=get_colors, cache=cache)
+
+    form = MyForm()
+    assert form.country.items == [(u'pe', u'Peru')]
+    assert form.color.items == [(u'red', u'Red')]
+
+    form.color.invalidate_items()
+    assert cache.get((get_countries, None)) == [(u'pe', u'Peru')]
+    assert cache.get((get_colors, None)) is None
+
+
+def test_callable_items_shared_cache_ttl():
+    import time
+
+    get_items, calls = _counting_items()
+    cache = f.ItemsCache(ttl=0.01)
+    field = f.Select(items=get_items, cache=cache)
+    field.items
+    field.items
+    assert len(calls) == 1
+    time.sleep(0.02)
+    field.items
+    assert len(calls) == 2
+
+
+def test_render_select_as_radios_classes():
+    items = [(1, u'A'), (2, u'B')]
+    field = f.Select(items=items)
+    field.name = 'abc'
+    field.load_data(obj_value=2)
+
+    expected = (
+        u'<label><input class="opt" name="abc" type="radio" value="1">'
+        u' A</label>\n'
+        u'<label><input class="opt" name="abc" type="radio" value="2"'
+        u' checked> B</label>'
+    )
+    assert field.as_radios(classes=u'opt') == expected
+
+
+def test_iter_select_matches_as_select():
+    items = [(str(i), 'Option <%d>' % i) for i in range(250)]
+    items.append([u'Group', ('a', 'A'), ('b', 'B')])
+    field = f.Select(items=items)
+    field.str_value = u'b'
+
+    chunks = list(field.iter_select(class_='x'))
+    assert len(chunks) > 1
+    assert all(isinstance(chunk, f.Markup) for chunk in chunks)
+    assert u''.join(chunks) == field.as_select(class_='x')
+
+    chunks = list(field.iter_radios())
+    assert all(isinstance(chunk, f.Markup) for chunk in chunks)
+    assert u''.join(chunks) == field.as_radios()
+    assert u''.join(field.iter_radiobuttons()) == field.as_radiobuttons()
+
+
+def test_rendered_options_are_cached():
+    items = [(u'a', u'A'), (u'b', u'<B>'), [u'Group', (1, u'1'), (2, u'2')]]
+    field = f.Select(items=items)
+    field.name = u'abc'
+    field.str_value = u'b'
+    expected = (
+        u'<select name="abc">\n'
+        u'<option value="a">A</option>\n'
+        u'<option value="b" selected>&lt;B&gt;</option>\n'
+        u'<optgroup label="Group">\n'
+        u'<option value="1">1</option>\n'
+        u'<option value="2">2</option>\n'
+        u'</optgroup>\n'
+        u'</select>'
+    )
+    assert field.as_select() == expected
+    options = field._items_index._options[1]
+    field.str_value = u'2'
+    html = field.as_select()
+    assert field._items_index._options[1] is options
+    assert u'<option value="2" selected>2</option>' in html
+    assert u'<option value="b">&lt;B&gt;</option>' in html
+
+    # A new list invalidates the cache
+    field.items = [(u'c', u'C')]
+    assert u'<option value="c">C</option>' in field.as_select()
+
+
+def test_rendered_options_cached_by_items_key():
+    calls = []
+
+    def get_items(form):
+        calls.append(1)
+        return [(u'a', u'A'), (u'b', u'B')]
+
+    class MyForm(f.Form):
+        a = f.Select(items=get_items, items_key=lambda form: form._locale)
+
+    form = MyForm({'a': u'a'}, locale='en')
+    assert u'<option value="a" selected>A</option>' in form.a.as_select()
+    options = form.a._items_index._keyed_options.get('en')
+    assert options is not None
+
+    form2 = MyForm({'a': u'b'}, locale='en')
+    assert u'<option value="b" selected>B</option>' in form2.a.as_select()
+    assert form2.a._items_index._keyed_options.get('en') is options
+
+
+def test_accepted_values_cached_by_items_key():
+    items = [(u'a', u'A')]
+
+    class MyForm(f.Form):
+        s = f.Select(items=items, items_key=lambda form: len(items))
+
+    form = MyForm({'s': u'a'})
+    assert form.is_valid()
+    items.append((u'b', u'B'))
+
+    form = MyForm({'s': u'b'})
+    assert u'<option value="b" selected>B</option>' in form.s.as_select()
+    assert form.is_valid()
+    assert form.cleaned_data['s'] == u'b'
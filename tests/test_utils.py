@@ -11,3 +11,72 @@ def test_html_attrs():
     assert result == expected
     assert utils.get_html_attrs() == u''
 
+
+def test_prefix_index():
+    data = {'addresses.2-email': u'a', 'meh-name': u'b', 'plain': u'c'}
+    files = {'photos.1-file': u'd'}
+    index = utils.PrefixIndex(data, files)
+    assert 'addresses.' in index
+    assert 'addresses.2-' in index
+    assert 'addresses.1-' not in index
+    assert 'addresses.2-email' not in index
+    assert 'meh-' in index
+    assert 'plain' not in index
+    assert 'photos.1-' in index
+
+    assert utils.PrefixIndex.get(index, data, files) is index
+    assert utils.PrefixIndex.get(index, dict(data), files) is not index
+    assert utils.PrefixIndex.get(None, data, files) is not index
+
+
+def test_lru_cache():
+    cache = utils.LRUCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert cache.get('b', 'missing') == 'missing'
+    assert len(cache) == 2
+
+    cache.invalidate('a')
+    assert 'a' not in cache
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_html_attrs_does_not_modify_kwargs():
+    attrs = {'classes': 'a  b', 'data_id': 1}
+    assert utils.get_html_attrs(attrs) == u'class="a b" data-id="1"'
+    assert attrs == {'classes': 'a  b', 'data_id': 1}
+
+
+def test_html_attrs_escaping():
+    assert utils.get_html_attrs({'title': u'it\'s'}) == u'title="it\'s"'
+    assert utils.get_html_attrs({'title': 3}) == u'title="3"'
+    assert utils.get_html_attrs({'classes': u'a"b'}) == u'class=\'a"b\''
+
+
+def test_html_attrs_template():
+    attrs = {
+        'name': 'abc', 'type': 'radio', 'classes': 'x', 'data_modal': True}
+    tmpl = utils.HtmlAttrsTemplate(attrs, flag='checked')
+    for value in (1, u'b', u'x y', None, True, False):
+        for flag in (True, False):
+            expected = dict(attrs, value=value, checked=flag)
+            assert tmpl.render(value, flag) == utils.get_html_attrs(expected)
+
+    tmpl = utils.HtmlAttrsTemplate(flag='selected')
+    assert tmpl.render(3, True) == u'value="3" selected'
+    assert tmpl.render(u'3', False) == u'value="3"'
+
+
+def test_get_timezone():
+    import pytz
+
+    tz = utils.get_timezone('America/Lima')
+    assert tz is pytz.timezone('America/Lima')
+    assert utils.get_timezone('America/Lima') is tz
+    assert utils.get_timezone(tz) is tz
+    assert utils.get_timezone(None) is None
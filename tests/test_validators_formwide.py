@@ -30,3 +30,10 @@ def test_atleastone():
     validator = f.AtLeastOne(['z', 'x'])
     assert not validator(data)
 
+
+def test_form_validators_inputs():
+    assert f.FormValidator().inputs is None
+    assert f.AreEqual('a', 'b').inputs == ('a', 'b')
+    assert f.AtLeastOne(['a', 'b', 'c']).inputs == ('a', 'b', 'c')
+    assert f.ValidSplitDate('d', 'm', 'y').inputs == ('d', 'm', 'y')
+    assert f.ValidSplitDate('d', 'm').inputs == ('d', 'm')